@@ -2,24 +2,365 @@
 """
 AI Gold Scalper - TensorFlow GPU Configuration for RTX 4050 Laptop
 Optimizes TensorFlow for 6GB VRAM and 16GB RAM constraints
+
+TensorFlow is imported lazily inside the methods that need it, so NVML-only
+consumers (get_gpu_status / monitor_gpu_memory) avoid the multi-second TF startup.
 """
 
-import tensorflow as tf
-import logging
+from __future__ import annotations
+
 import os
-import psutil
+import tempfile
+
+# XLA mode: "off", "auto_cluster" (TF picks clusters via TF_XLA_FLAGS) or
+# "explicit" (only functions decorated with jit_compile=True are compiled).
+# TF_XLA_FLAGS is read when TensorFlow starts, so it must be set before it is first imported;
+# the mode is therefore fixed at import time from AI_GOLD_XLA_MODE.
+XLA_MODES = ("off", "auto_cluster", "explicit")
+XLA_AUTO_JIT_FLAGS = "--tf_xla_auto_jit=2 --tf_xla_cpu_global_jit"
+_XLA_MODE_REQUESTED = os.environ.get("AI_GOLD_XLA_MODE", "auto_cluster")
+XLA_MODE = _XLA_MODE_REQUESTED if _XLA_MODE_REQUESTED in XLA_MODES else "auto_cluster"
+
+# Compiled XLA executables persist here so later runs skip recompilation;
+# optimized HLO of the benchmark kernels is also dumped here for inspection/tfcompile.
+# TF splits TF_XLA_FLAGS on whitespace, so a path with spaces (e.g. "G:\My Drive\...")
+# falls back to the temp dir, and the flag is dropped if that has spaces too.
+def _xla_cache_dir():
+    """Pick the XLA cache dir; returns (path, whether it can go in TF_XLA_FLAGS)"""
+    for base in (os.path.join(os.path.dirname(os.path.abspath(__file__)), "laptop"),
+                 os.path.join(tempfile.gettempdir(), "ai_gold_scalper")):
+        path = os.path.join(base, "xla_cache")
+        if not any(c.isspace() for c in path):
+            return path, True
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "laptop", "xla_cache"), False
+
+XLA_CACHE_DIR, _XLA_CACHE_DIR_FLAG_SAFE = _xla_cache_dir()
+XLA_PERSISTENT_CACHE_FLAG = (f"--tf_xla_persistent_cache_directory={XLA_CACHE_DIR}"
+                             if _XLA_CACHE_DIR_FLAG_SAFE else None)
+
+if XLA_MODE != "off":
+    _xla_flags = [XLA_PERSISTENT_CACHE_FLAG] if XLA_PERSISTENT_CACHE_FLAG else []
+    if XLA_MODE == "auto_cluster":
+        _xla_flags.insert(0, XLA_AUTO_JIT_FLAGS)
+    if _xla_flags:
+        os.environ.setdefault("TF_XLA_FLAGS", " ".join(_xla_flags))
+
+import atexit
+import concurrent.futures
+import functools
+import gc
+import json
+import logging
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+
+
+# Cache of autotuned (inter_op, intra_op) pairs keyed by "<cpu_model>|<model_size>"
+AUTOTUNE_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "laptop", "tf_thread_autotune.json")
+
+# Inter-op pool scaling per model size (small models run more independent ops)
+MODEL_SIZE_INTER_OP_SCALE = {"small": 1.5, "medium": 1.0, "large": 0.5}
+
+# Timed iterations for the matmul benchmark in test_gpu_configuration
+BENCHMARK_ITERATIONS = 50
+
+# Benchmark kernels are specialised to this fixed shape so they trace and compile once
+BENCHMARK_SHAPE = [1000, 1000]
+
+# Default time a dynamic NVML reading (memory/utilisation/temperature) is reused (seconds)
+MONITOR_CACHE_TTL = 0.2
+
+# VRAM kept free for the OS/driver when the limit is derived from the probed total
+GPU_MEMORY_BUFFER_MB = 1024
+MIN_GPU_MEMORY_LIMIT_MB = 512
+DEFAULT_GPU_MEMORY_LIMIT_MB = 5120  # used when VRAM cannot be probed (6GB RTX 4050)
+
+# Memory limit per model size as a fraction of total VRAM, with absolute
+# fallbacks (MB) for when the total cannot be probed
+MODEL_SIZE_MEMORY_FRACTION = {"small": 0.6, "medium": 0.85, "large": 0.95}
+MODEL_SIZE_MEMORY_FALLBACK_MB = {"small": 3072, "medium": 5120, "large": 5632}
+
+
+# Dumped HLO file name for each benchmark kernel ("float32" or a mixed precision policy)
+BENCHMARK_HLO_NAMES = {
+    'float32': "matmul_1000_fp32",
+    'mixed_float16': "matmul_1000_fp16",
+    'mixed_bfloat16': "matmul_1000_bf16",
+}
+
+# BF16 Tensor Cores (same throughput as FP16, no loss scaling) need Ampere or newer
+BF16_MIN_COMPUTE_CAPABILITY = (8, 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _physical_cores():
+    """Physical (non-SMT) core count; psutil is only loaded when threads are tuned"""
+    import psutil
+    return psutil.cpu_count(logical=False) or 1
+
+
+def _physical_core_cpu_ids():
+    """One logical CPU id per physical core (first SMT sibling of each)"""
+    import psutil
+    
+    # Linux exposes the real sibling layout; elsewhere assume cores come first
+    topology = "/sys/devices/system/cpu/cpu{}/topology/thread_siblings_list"
+    cpu_ids = set()
+    try:
+        for cpu in range(psutil.cpu_count(logical=True) or 1):
+            with open(topology.format(cpu)) as f:
+                first_sibling = f.read().strip().replace("-", ",").split(",")[0]
+            cpu_ids.add(int(first_sibling))
+        return sorted(cpu_ids)
+    except (OSError, ValueError):
+        return list(range(_physical_cores()))
+
+
+def _import_tensorflow():
+    """Import TensorFlow, first setting the OpenMP/MKL environment it reads on load.
+
+    Thread pools are sized by physical cores; SMT siblings only oversubscribe Eigen/OpenMP.
+    """
+    if "tensorflow" not in sys.modules:
+        os.environ.setdefault("OMP_NUM_THREADS", str(_physical_cores()))
+        os.environ.setdefault("KMP_BLOCKTIME", "0")
+        # Stream-ordered CUDA pool allocator fragments less than the default BFC allocator
+        os.environ.setdefault("TF_GPU_ALLOCATOR", "cuda_malloc_async")
+    
+    import tensorflow as tf
+    return tf
+
+
+@functools.lru_cache(maxsize=1)
+def _get_benchmark_kernels():
+    """XLA-compiled matmul kernels keyed by "float32" and mixed precision policy.
+
+    The mixed precision kernels take FP32 inputs and cast internally so XLA
+    fuses the casts into the matmul instead of materialising copies in VRAM.
+    """
+    tf = _import_tensorflow()
+    
+    signature = [tf.TensorSpec(BENCHMARK_SHAPE, tf.float32)] * 2
+    
+    @tf.function(jit_compile=True, input_signature=signature)
+    def bench_matmul(a, b):
+        return tf.matmul(a, b)
+    
+    @tf.function(jit_compile=True, input_signature=signature)
+    def bench_matmul_fp16(a, b):
+        return tf.matmul(tf.cast(a, tf.float16), tf.cast(b, tf.float16))
+    
+    @tf.function(jit_compile=True, input_signature=signature)
+    def bench_matmul_bf16(a, b):
+        return tf.matmul(tf.cast(a, tf.bfloat16), tf.cast(b, tf.bfloat16))
+    
+    return {
+        'float32': bench_matmul,
+        'mixed_float16': bench_matmul_fp16,
+        'mixed_bfloat16': bench_matmul_bf16,
+    }
+
+
+def _dump_benchmark_hlo(kernel_name, a, b):
+    """Write the kernel's optimized HLO to the XLA cache once (input for tfcompile AOT builds)"""
+    hlo_path = os.path.join(XLA_CACHE_DIR, f"{BENCHMARK_HLO_NAMES[kernel_name]}.hlo")
+    if os.path.exists(hlo_path):
+        return hlo_path
+    
+    try:
+        kernel = _get_benchmark_kernels()[kernel_name]
+        hlo = kernel.experimental_get_compiler_ir(a, b)(stage="optimized_hlo")
+        os.makedirs(XLA_CACHE_DIR, exist_ok=True)
+        with open(hlo_path, 'w') as f:
+            f.write(hlo)
+        logging.info(f"Saved optimized HLO to {hlo_path}")
+        return hlo_path
+    except Exception as e:
+        logging.warning(f"Could not dump optimized HLO: {e}")
+        return None
+
+
+def _median_kernel_time(kernel, a, b, iterations=BENCHMARK_ITERATIONS):
+    """Median wall time of kernel(a, b) in seconds, excluding the compile call.
+
+    Timing is host-side; .numpy() forces a device sync so the full kernel
+    execution is measured rather than just its asynchronous launch.
+    """
+    # First call traces and compiles; keep it out of the measurement
+    kernel(a, b).numpy()
+    
+    timings_ns = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        kernel(a, b).numpy()
+        timings_ns.append(time.perf_counter_ns() - start)
+    
+    # The fixed input_signature should yield exactly one concrete function
+    tracing_count = kernel.experimental_get_tracing_count()
+    if tracing_count > 1:
+        logging.warning(f"Benchmark kernel retraced {tracing_count} times; timings include retracing")
+    
+    return statistics.median(timings_ns) / 1e9
+
+
+def _matmul_gflops(elapsed, n=BENCHMARK_SHAPE[0]):
+    """Achieved GFLOPS of an n x n matmul (2 * n^3 flops) that took `elapsed` seconds"""
+    return 2 * n ** 3 / elapsed / 1e9
+
+
+def _cupy_matmul_time(iterations=BENCHMARK_ITERATIONS):
+    """Median FP32 matmul time on raw cuBLAS via CuPy, or None if CuPy is not installed"""
+    try:
+        import cupy as cp
+    except ImportError:
+        return None
+    
+    a = cp.random.standard_normal(BENCHMARK_SHAPE, dtype=cp.float32)
+    b = cp.random.standard_normal(BENCHMARK_SHAPE, dtype=cp.float32)
+    device = cp.cuda.Device()
+    
+    # Warm up cuBLAS handle and kernel selection
+    cp.matmul(a, b)
+    device.synchronize()
+    
+    timings_ns = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        cp.matmul(a, b)
+        device.synchronize()
+        timings_ns.append(time.perf_counter_ns() - start)
+    
+    del a, b
+    cp.get_default_memory_pool().free_all_blocks()
+    return statistics.median(timings_ns) / 1e9
+
+
+def _default_thread_counts():
+    """Recommended (inter_op, intra_op) thread counts for this CPU.
+
+    TF_INTER_OP / TF_INTRA_OP environment variables override the defaults.
+    """
+    physical = _physical_cores()
+    inter = int(os.environ.get("TF_INTER_OP", max(1, min(4, physical // 2))))
+    intra = int(os.environ.get("TF_INTRA_OP", physical))
+    return inter, intra
+
+
+def _cpu_model():
+    """Best-effort CPU model string used as the autotune cache key"""
+    return platform.processor() or platform.machine() or "unknown"
+
+
+def _load_autotune_cache():
+    """Contents of AUTOTUNE_CACHE_FILE, or {} if it is missing or unreadable"""
+    if not os.path.exists(AUTOTUNE_CACHE_FILE):
+        return {}
+    try:
+        with open(AUTOTUNE_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable autotune cache: {e}")
+        return {}
+
+
+def _cached_thread_counts(model_size):
+    """Autotuned (inter_op, intra_op) for this CPU and model size, or None if never tuned"""
+    cached = _load_autotune_cache().get(f"{_cpu_model()}|{model_size}")
+    return tuple(cached) if cached else None
+
+
+def _tuned_thread_counts(model_size="medium"):
+    """(inter_op, intra_op) to apply: env overrides, then the autotune cache, then core-count defaults"""
+    inter, intra = _default_thread_counts()
+    cached = _cached_thread_counts(model_size)
+    if cached:
+        if "TF_INTER_OP" not in os.environ:
+            inter = cached[0]
+        if "TF_INTRA_OP" not in os.environ:
+            intra = cached[1]
+    return inter, intra
+
+
+def _time_thread_config(model_fn, inter, intra, warmup_steps, timed_steps):
+    """Time model_fn under a given thread configuration (runs in a fresh process)"""
+    tf = _import_tensorflow()
+
+    tf.config.threading.set_inter_op_parallelism_threads(inter)
+    tf.config.threading.set_intra_op_parallelism_threads(intra)
+
+    for _ in range(warmup_steps):
+        model_fn()
+
+    start = time.perf_counter()
+    for _ in range(timed_steps):
+        model_fn()
+    return (time.perf_counter() - start) / timed_steps
 
 
 class LaptopGPUConfig:
     """TensorFlow GPU configuration optimized for RTX 4050 laptop"""
     
+    # NVML is initialised once per process; the device handle and static info are shared
+    _nvml_initialized = False
+    _nvml_handle = None
+    _nvml_static_info = None
+    
     def __init__(self):
-        self.gpu_memory_limit = 5120  # 5GB (leaving 1GB buffer)
+        self.dynamic_info_ttl = MONITOR_CACHE_TTL
+        self._dynamic_info = None
+        self._dynamic_info_time = 0.0
+        
+        # Total VRAM minus an OS/driver buffer; None = memory growth, no cap
+        self.total_gpu_memory_mb = self._probe_total_gpu_memory_mb()
+        if self.total_gpu_memory_mb is None:
+            self.gpu_memory_limit = DEFAULT_GPU_MEMORY_LIMIT_MB
+        else:
+            self.gpu_memory_limit = max(MIN_GPU_MEMORY_LIMIT_MB,
+                                        self.total_gpu_memory_mb - GPU_MEMORY_BUFFER_MB)
+        
         self.enable_mixed_precision = True
-        self.enable_xla = True
+        self.mixed_precision_policy = 'mixed_float16'  # resolved per GPU in configure_gpu_for_laptop
+        self.inter_op_threads = None  # resolved from core counts in configure_gpu_for_laptop
+        self.intra_op_threads = None
+        self._configured = False
+    
+    @property
+    def enable_xla(self) -> str:
+        """XLA mode (one of XLA_MODES), fixed at import from AI_GOLD_XLA_MODE"""
+        return XLA_MODE
+    
+    def _probe_total_gpu_memory_mb(self):
+        """Total VRAM of GPU 0 in MB via NVML, or None if it cannot be read"""
+        try:
+            return self._get_static_info()["total_memory_mb"]
+        except ImportError:
+            return None
+        except Exception as e:
+            logging.warning(f"Could not probe GPU memory, using {DEFAULT_GPU_MEMORY_LIMIT_MB}MB limit: {e}")
+            return None
+        
+    def configure_gpu_for_laptop(self, pin_cpu=False):
+        """Optimize TensorFlow for RTX 4050 laptop
         
-    def configure_gpu_for_laptop(self):
-        """Optimize TensorFlow for RTX 4050 laptop"""
+        pin_cpu=True pins this process to one logical CPU per physical core so
+        Eigen/OpenMP workers stay on their cores; off by default as it can starve
+        the desktop UI on a laptop.
+        """
+        
+        # TF rejects device configuration once the GPU is initialised, so only apply it once
+        if self._configured:
+            return True
+        
+        import psutil
+        
+        # OpenMP reads KMP_AFFINITY when TensorFlow loads
+        if pin_cpu:
+            os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
+        tf = _import_tensorflow()
         
         try:
             # Get available GPUs
@@ -34,34 +375,76 @@ class LaptopGPUConfig:
             # Configure first GPU (RTX 4050)
             gpu = gpus[0]
             
-            # Enable memory growth to prevent VRAM allocation issues
-            tf.config.experimental.set_memory_growth(gpu, True)
-            
-            # Set memory limit to 5GB (leaving 1GB buffer for system)
-            tf.config.set_logical_device_configuration(
-                gpu,
-                [tf.config.LogicalDeviceConfiguration(memory_limit=self.gpu_memory_limit)]
-            )
+            # Memory growth and a hard VRAM cap are mutually exclusive in TensorFlow.
+            # With gpu_memory_limit=None, grow on demand; otherwise enforce the cap.
+            # VirtualDeviceConfiguration is used because LogicalDeviceConfiguration's
+            # memory_limit is not honoured on recent TF releases.
+            if self.gpu_memory_limit is None:
+                tf.config.experimental.set_memory_growth(gpu, True)
+            else:
+                tf.config.experimental.set_virtual_device_configuration(
+                    gpu,
+                    [tf.config.experimental.VirtualDeviceConfiguration(memory_limit=self.gpu_memory_limit)]
+                )
             
             # Enable mixed precision for better performance and memory usage
+            # BF16 keeps FP32 range, so no loss scaling or extra Cast bookkeeping is needed
             if self.enable_mixed_precision:
-                tf.keras.mixed_precision.set_global_policy('mixed_float16')
-                logging.info("✅ Mixed precision enabled (float16)")
+                details = tf.config.experimental.get_device_details(gpu)
+                compute_capability = details.get("compute_capability") or (0, 0)
+                if tuple(compute_capability) >= BF16_MIN_COMPUTE_CAPABILITY:
+                    self.mixed_precision_policy = 'mixed_bfloat16'
+                else:
+                    self.mixed_precision_policy = 'mixed_float16'
+                tf.keras.mixed_precision.set_global_policy(self.mixed_precision_policy)
+                logging.info(f"✅ Mixed precision enabled ({self.mixed_precision_policy}, "
+                             f"compute capability {compute_capability})")
+            
+            # Report the XLA mode applied at import (auto-clustering via env flags,
+            # or explicit jit_compile only); TF_XLA_FLAGS can't be changed after TF loads
+            if _XLA_MODE_REQUESTED != XLA_MODE:
+                logging.warning(f"Unknown XLA mode {_XLA_MODE_REQUESTED!r}, using {XLA_MODE!r}")
+            
+            applied_flags = os.environ.get("TF_XLA_FLAGS", "")
+            auto_jit_applied = "--tf_xla_auto_jit" in applied_flags and "--tf_xla_auto_jit=0" not in applied_flags
+            if auto_jit_applied != (self.enable_xla == "auto_cluster"):
+                logging.warning(f"XLA mode {self.enable_xla!r} does not match the applied "
+                                f"TF_XLA_FLAGS={applied_flags!r}; the flags take precedence")
+            
+            if self.enable_xla == "auto_cluster":
+                logging.info(f"✅ XLA auto-clustering enabled (TF_XLA_FLAGS={applied_flags})")
+            elif self.enable_xla == "explicit":
+                logging.info("✅ XLA explicit mode (jit_compile=True functions only)")
+            else:
+                logging.info("XLA disabled")
             
-            # Enable XLA compilation for faster execution
-            if self.enable_xla:
-                tf.config.optimizer.set_jit(True)
-                logging.info("✅ XLA acceleration enabled")
+            # Configure threading from env overrides, the autotune cache or detected core counts
+            if self.inter_op_threads is None or self.intra_op_threads is None:
+                self.inter_op_threads, self.intra_op_threads = _tuned_thread_counts()
+            logical = psutil.cpu_count(logical=True)
+            tf.config.threading.set_inter_op_parallelism_threads(self.inter_op_threads)
+            tf.config.threading.set_intra_op_parallelism_threads(self.intra_op_threads)
             
-            # Configure threading for AMD Ryzen 5 8654HS (6 cores, 12 threads)
-            tf.config.threading.set_inter_op_parallelism_threads(6)
-            tf.config.threading.set_intra_op_parallelism_threads(12)
+            if pin_cpu:
+                try:
+                    cpu_ids = _physical_core_cpu_ids()
+                    psutil.Process().cpu_affinity(cpu_ids)
+                    logging.info(f"✅ Pinned to CPUs {cpu_ids}")
+                except (AttributeError, psutil.Error, OSError) as e:
+                    # cpu_affinity is unavailable on macOS
+                    logging.warning(f"CPU pinning not applied: {e}")
             
             logging.info("✅ GPU configured for laptop optimization")
-            logging.info(f"   - Memory limit: {self.gpu_memory_limit}MB")
-            logging.info(f"   - Mixed precision: {self.enable_mixed_precision}")
-            logging.info(f"   - XLA acceleration: {self.enable_xla}")
+            if self.gpu_memory_limit is None:
+                logging.info("   - Memory limit: none (memory growth enabled)")
+            else:
+                logging.info(f"   - Memory limit: {self.gpu_memory_limit}MB")
+            logging.info(f"   - Threads: inter_op={self.inter_op_threads}, "
+                         f"intra_op={self.intra_op_threads} ({logical} logical CPUs)")
+            logging.info(f"   - Mixed precision: {self.enable_mixed_precision} ({self.mixed_precision_policy})")
+            logging.info(f"   - XLA mode: {self.enable_xla}")
             
+            self._configured = True
             return True
             
         except RuntimeError as e:
@@ -71,45 +454,102 @@ class LaptopGPUConfig:
             logging.error(f"❌ Unexpected error during GPU configuration: {e}")
             return False
     
+    @classmethod
+    def _get_nvml_handle(cls):
+        """Return the cached NVML handle for GPU 0, initialising NVML on first use"""
+        import pynvml
+        
+        if not cls._nvml_initialized:
+            pynvml.nvmlInit()
+            atexit.register(pynvml.nvmlShutdown)
+            cls._nvml_initialized = True
+        
+        if cls._nvml_handle is None:
+            cls._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        return cls._nvml_handle
+    
+    @classmethod
+    def _get_static_info(cls):
+        """GPU properties that never change (name, total memory, compute capability), read once"""
+        if cls._nvml_static_info is None:
+            import pynvml
+            handle = cls._get_nvml_handle()
+            
+            gpu_name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(gpu_name, bytes):  # older pynvml returns bytes
+                gpu_name = gpu_name.decode('utf-8')
+            
+            cls._nvml_static_info = {
+                "gpu_count": pynvml.nvmlDeviceGetCount(),
+                "gpu_name": gpu_name,
+                "total_memory_mb": pynvml.nvmlDeviceGetMemoryInfo(handle).total >> 20,
+                "compute_capability": pynvml.nvmlDeviceGetCudaComputeCapability(handle),
+            }
+        return cls._nvml_static_info
+    
+    def _get_dynamic_info(self):
+        """Per-poll GPU readings (memory, utilisation, temperature), reused for dynamic_info_ttl seconds"""
+        now = time.monotonic()
+        if self._dynamic_info is None or now - self._dynamic_info_time >= self.dynamic_info_ttl:
+            import pynvml
+            handle = self._get_nvml_handle()
+            
+            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            
+            # Many laptop GPUs and WSL drivers report NotSupported for these;
+            # keep the memory reading and leave them as None
+            try:
+                gpu_utilization = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+            except pynvml.NVMLError:
+                gpu_utilization = None
+            try:
+                temperature_c = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            except pynvml.NVMLError:
+                temperature_c = None
+            
+            self._dynamic_info = {
+                "used_memory_mb": memory_info.used >> 20,
+                "free_memory_mb": memory_info.free >> 20,
+                "memory_utilization": (memory_info.used / memory_info.total) * 100,
+                "gpu_utilization": gpu_utilization,
+                "temperature_c": temperature_c,
+            }
+            self._dynamic_info_time = now
+        return self._dynamic_info
+    
     def get_gpu_info(self):
         """Get GPU information and current usage"""
         try:
-            # TensorFlow GPU info
-            gpus = tf.config.experimental.list_physical_devices('GPU')
-            
-            if not gpus:
-                return {"error": "No GPU detected"}
-            
             gpu_info = {
-                "gpu_count": len(gpus),
-                "gpu_names": [gpu.name for gpu in gpus],
                 "memory_limit_mb": self.gpu_memory_limit,
                 "mixed_precision": self.enable_mixed_precision,
-                "xla_enabled": self.enable_xla
+                "mixed_precision_policy": self.mixed_precision_policy,
+                "xla_enabled": self.enable_xla != "off",
+                "xla_mode": self.enable_xla
             }
             
-            # Try to get detailed GPU info using nvidia-ml-py if available
+            # Prefer nvidia-ml-py, which answers without starting TensorFlow
             try:
-                import pynvml
-                pynvml.nvmlInit()
-                
-                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-                gpu_name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
-                memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                
-                gpu_info.update({
-                    "gpu_name": gpu_name,
-                    "total_memory_mb": memory_info.total // 1024 // 1024,
-                    "used_memory_mb": memory_info.used // 1024 // 1024,
-                    "free_memory_mb": memory_info.free // 1024 // 1024,
-                    "memory_utilization": (memory_info.used / memory_info.total) * 100
-                })
+                gpu_info.update(self._get_static_info())
+                gpu_info.update(self._get_dynamic_info())
+                return gpu_info
                 
             except ImportError:
                 logging.info("pynvml not available. Install with: pip install pynvml")
             except Exception as e:
                 logging.warning(f"Could not get detailed GPU info: {e}")
             
+            # Fall back to TensorFlow device listing
+            tf = _import_tensorflow()
+            gpus = tf.config.experimental.list_physical_devices('GPU')
+            
+            if not gpus:
+                return {"error": "No GPU detected"}
+            
+            gpu_info.update({
+                "gpu_count": len(gpus),
+                "gpu_names": [gpu.name for gpu in gpus]
+            })
             return gpu_info
             
         except Exception as e:
@@ -118,19 +558,19 @@ class LaptopGPUConfig:
     def monitor_gpu_memory(self):
         """Monitor GPU memory usage and provide warnings"""
         try:
-            import pynvml
-            pynvml.nvmlInit()
+            # Hot polling loops reuse the reading for dynamic_info_ttl seconds
+            info = self._get_dynamic_info()
             
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-            
-            used_percentage = (memory_info.used / memory_info.total) * 100
+            used_percentage = info["memory_utilization"]
+            util = "n/a" if info['gpu_utilization'] is None else f"{info['gpu_utilization']}%"
+            temp = "n/a" if info['temperature_c'] is None else f"{info['temperature_c']}°C"
+            load = f"GPU util {util}, {temp}"
             
             if used_percentage > 90:
-                logging.warning(f"⚠️  GPU memory usage high: {used_percentage:.1f}%")
+                logging.warning(f"⚠️  GPU memory usage high: {used_percentage:.1f}% ({load})")
                 return "high"
             elif used_percentage > 75:
-                logging.info(f"GPU memory usage: {used_percentage:.1f}%")
+                logging.info(f"GPU memory usage: {used_percentage:.1f}% ({load})")
                 return "medium"
             else:
                 return "low"
@@ -143,35 +583,97 @@ class LaptopGPUConfig:
     def optimize_for_model_size(self, model_size="medium"):
         """Adjust configuration based on model size"""
         
-        if model_size == "small":
-            # For small models, allow more concurrent operations
-            self.gpu_memory_limit = 3072  # 3GB
-            tf.config.threading.set_inter_op_parallelism_threads(8)
-            
-        elif model_size == "medium":
-            # Default configuration for medium models
-            self.gpu_memory_limit = 5120  # 5GB
-            tf.config.threading.set_inter_op_parallelism_threads(6)
-            
-        elif model_size == "large":
-            # For large models, use maximum memory
-            self.gpu_memory_limit = 5632  # 5.5GB (aggressive)
-            tf.config.threading.set_inter_op_parallelism_threads(4)
+        # Small models use ~60% of VRAM, medium ~85%, large ~95% (aggressive)
+        if model_size in MODEL_SIZE_MEMORY_FRACTION:
+            if self.total_gpu_memory_mb is None:
+                self.gpu_memory_limit = MODEL_SIZE_MEMORY_FALLBACK_MB[model_size]
+            else:
+                self.gpu_memory_limit = int(self.total_gpu_memory_mb * MODEL_SIZE_MEMORY_FRACTION[model_size])
+        
+        tf = _import_tensorflow()
+        
+        # A pair autotuned for this model size wins; otherwise only inter_op is
+        # scaled and intra_op stays at the tuned per-core value
+        if _cached_thread_counts(model_size) and "TF_INTER_OP" not in os.environ:
+            self.inter_op_threads, _ = _tuned_thread_counts(model_size)
+        else:
+            base_inter, _ = _tuned_thread_counts()
+            scale = MODEL_SIZE_INTER_OP_SCALE.get(model_size, 1.0)
+            self.inter_op_threads = max(1, min(4, round(base_inter * scale)))
+        tf.config.threading.set_inter_op_parallelism_threads(self.inter_op_threads)
             
         logging.info(f"GPU configuration optimized for {model_size} models")
         logging.info(f"Memory limit set to: {self.gpu_memory_limit}MB")
+        logging.info(f"Inter-op threads set to: {self.inter_op_threads}")
+    
+    @classmethod
+    def autotune(cls, model_fn, model_size="medium", warmup_steps=2, timed_steps=5):
+        """Sweep inter/intra-op thread counts for model_fn and cache the fastest pair.
+        
+        TensorFlow only accepts thread settings before its runtime starts, so every
+        candidate is timed in a fresh spawned process; model_fn must be picklable
+        (a module-level function). Returns the best (inter_op, intra_op) tuple;
+        configure_gpu_for_laptop and optimize_for_model_size apply it on later runs.
+        """
+        import psutil
+        
+        key = f"{_cpu_model()}|{model_size}"
+        
+        cache = _load_autotune_cache()
+        if key in cache:
+            inter, intra = cache[key]
+            logging.info(f"Using cached thread config for {key}: inter_op={inter}, intra_op={intra}")
+            return inter, intra
+        
+        physical = psutil.cpu_count(logical=False) or 1
+        logical = psutil.cpu_count(logical=True) or physical
+        # Recommended ranges: inter_op 1-4, intra_op around the core count (0 = TF auto)
+        intra_candidates = sorted({0, max(1, physical // 2), physical, logical})
+        candidates = [(inter, intra) for inter in range(1, 5) for intra in intra_candidates]
+        
+        spawn_ctx = multiprocessing.get_context("spawn")
+        results = {}
+        for inter, intra in candidates:
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=spawn_ctx) as pool:
+                    elapsed = pool.submit(_time_thread_config, model_fn, inter, intra,
+                                          warmup_steps, timed_steps).result()
+                results[(inter, intra)] = elapsed
+                logging.info(f"   inter_op={inter}, intra_op={intra}: {elapsed * 1000:.1f}ms/step")
+            except Exception as e:
+                logging.warning(f"Autotune candidate inter_op={inter}, intra_op={intra} failed: {e}")
+        
+        if not results:
+            logging.error("❌ Autotune failed for every candidate, keeping defaults")
+            return _default_thread_counts()
+        
+        inter, intra = min(results, key=results.get)
+        cache[key] = [inter, intra]
+        try:
+            os.makedirs(os.path.dirname(AUTOTUNE_CACHE_FILE), exist_ok=True)
+            with open(AUTOTUNE_CACHE_FILE, 'w') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            logging.warning(f"Could not write autotune cache: {e}")
+        
+        logging.info(f"✅ Autotuned {key}: inter_op={inter}, intra_op={intra}")
+        return inter, intra
 
 
-def configure_gpu_for_laptop():
+@functools.lru_cache(maxsize=1)
+def _get_config():
+    """Process-wide LaptopGPUConfig shared by the module-level helpers"""
+    return LaptopGPUConfig()
+
+
+def configure_gpu_for_laptop(pin_cpu=False):
     """Main function to configure GPU for laptop"""
-    config = LaptopGPUConfig()
-    return config.configure_gpu_for_laptop()
+    return _get_config().configure_gpu_for_laptop(pin_cpu=pin_cpu)
 
 
 def get_gpu_status():
     """Get current GPU status"""
-    config = LaptopGPUConfig()
-    return config.get_gpu_info()
+    return _get_config().get_gpu_info()
 
 
 def test_gpu_configuration():
@@ -181,39 +683,53 @@ def test_gpu_configuration():
         if not configure_gpu_for_laptop():
             return False
         
+        tf = _import_tensorflow()
+        kernels = _get_benchmark_kernels()
+        
         # Test tensor operations
         print("🧪 Testing GPU configuration...")
         
         # Create test tensors
         with tf.device('/GPU:0'):
-            a = tf.random.normal([1000, 1000])
-            b = tf.random.normal([1000, 1000])
+            # Variables keep shape/dtype fixed across calls so the kernels never retrace
+            a = tf.Variable(tf.random.normal(BENCHMARK_SHAPE), trainable=False)
+            b = tf.Variable(tf.random.normal(BENCHMARK_SHAPE), trainable=False)
             
-            # Matrix multiplication
-            start_time = tf.timestamp()
-            c = tf.matmul(a, b)
-            end_time = tf.timestamp()
-            
-            computation_time = end_time - start_time
+            # Matrix multiplication (median of compiled runs)
+            computation_time = _median_kernel_time(kernels['float32'], a, b)
+            _dump_benchmark_hlo('float32', a, b)
             
         print(f"✅ GPU test completed successfully!")
-        print(f"   Matrix multiplication (1000x1000): {computation_time:.3f}s")
+        print(f"   Matrix multiplication (1000x1000, median of {BENCHMARK_ITERATIONS}): {computation_time:.6f}s "
+              f"({_matmul_gflops(computation_time):.1f} GFLOPS)")
         
         # Test mixed precision if enabled
-        config = LaptopGPUConfig()
+        config = _get_config()
         if config.enable_mixed_precision:
+            policy = config.mixed_precision_policy
             with tf.device('/GPU:0'):
-                a_fp16 = tf.cast(a, tf.float16)
-                b_fp16 = tf.cast(b, tf.float16)
-                
-                start_time = tf.timestamp()
-                c_fp16 = tf.matmul(a_fp16, b_fp16)
-                end_time = tf.timestamp()
+                mixed_time = _median_kernel_time(kernels[policy], a, b)
+                _dump_benchmark_hlo(policy, a, b)
                 
-                fp16_time = end_time - start_time
-                
-            print(f"   Mixed precision test: {fp16_time:.3f}s")
-            print(f"   Performance improvement: {((computation_time - fp16_time) / computation_time * 100):.1f}%")
+            print(f"   Mixed precision test ({config.mixed_precision_policy}): {mixed_time:.6f}s "
+                  f"({_matmul_gflops(mixed_time):.1f} GFLOPS)")
+            print(f"   Performance improvement: {((computation_time - mixed_time) / computation_time * 100):.1f}%")
+        
+        # Raw cuBLAS baseline shows how much of the FP32 time is TF/XLA overhead
+        try:
+            cublas_time = _cupy_matmul_time()
+        except Exception as e:
+            cublas_time = None
+            logging.warning(f"CuPy baseline failed: {e}")
+        if cublas_time is not None:
+            print(f"   cuBLAS baseline (CuPy, FP32): {cublas_time:.6f}s "
+                  f"({_matmul_gflops(cublas_time):.1f} GFLOPS)")
+            print(f"   TF/XLA overhead vs cuBLAS: {computation_time / cublas_time:.2f}x")
+        
+        # Both passes share the same FP32 inputs; release them and Keras state once done
+        del a, b
+        gc.collect()
+        tf.keras.backend.clear_session()
         
         return True
         
@@ -19,19 +19,256 @@ import subprocess
 import threading
 import signal
 import json
+import queue
 import socket
-import psutil
 import logging
 import hashlib
 import secrets
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor
-import requests
+from typing import Dict, List, Optional, Set, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 import argparse
+from collections import defaultdict, deque
+
+# Heavy third-party modules are imported on first use so short CLI commands
+# (status, stop) don't pay for them; see _lazy_import()
+requests = None
+HTTPAdapter = None
+
+def _lazy_import():
+    """Import requests into module globals on first use"""
+    global requests, HTTPAdapter
+    if requests is None:
+        import requests as _requests
+        from requests.adapters import HTTPAdapter as _HTTPAdapter
+        requests, HTTPAdapter = _requests, _HTTPAdapter
+
+# Monitoring cadence: process exits are reported immediately by watcher threads,
+# HTTP/port health probes run at most once per HEALTH_CACHE_TTL_S per component
+DEFAULT_MONITOR_INTERVAL_S = 30
+MIN_MONITOR_INTERVAL_S = 5
+HEALTH_CACHE_TTL_S = 60
+HEALTH_PROBE_TIMEOUT_S = 6  # overall budget for one round of concurrent probes
+PORT_PROBE_TIMEOUT_S = 0.25  # loopback connect for components without a health endpoint
+RESTART_BACKOFF_MAX_S = 600  # auto-restart delay grows as 2**restart_count up to this cap
+
+# Enhanced component configurations with full Phase 4 integration. Built once at
+# import; each orchestrator takes a shallow per-component copy it may annotate.
+_COMPONENT_SPEC: Dict[str, Dict[str, Any]] = {
+    # Core AI Infrastructure
+    'ai_server': {
+        'script': 'core/enhanced_ai_server_consolidated.py',
+        'port': 5000,
+        'health_endpoint': '/health',
+        'dependencies': ('model_registry',),
+        'type': 'service',
+        'critical': True,
+        'restart_policy': 'always',
+        'startup_delay': 0
+    },
+    'performance_dashboard': {
+        'script': 'scripts/monitoring/performance_dashboard.py',
+        'port': 8080,
+        'health_endpoint': '/api/system-status',
+        'dependencies': ('ai_server',),
+        'type': 'service',
+        'critical': True,
+        'restart_policy': 'always',
+        'startup_delay': 5
+    },
+    
+    # AI System Components
+    'model_registry': {
+        'script': 'scripts/ai/model_registry.py',
+        'type': 'persistent_service',
+        'dependencies': (),
+        'critical': True,
+        'restart_policy': 'always',
+        'startup_delay': 0,
+        'health_check': 'database_connection'
+    },
+    'ensemble_system': {
+        'script': 'scripts/ai/ensemble_models.py',
+        'type': 'on_demand_service',
+        'dependencies': ('model_registry',),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 10,
+        'health_check': 'model_availability'
+    },
+    'regime_detector': {
+        'script': 'scripts/ai/market_regime_detector.py',
+        'type': 'continuous_service',
+        'dependencies': (),
+        'critical': False,
+        'restart_policy': 'always',
+        'startup_delay': 3,
+        'health_check': 'detection_active'
+    },
+    'phase4_controller': {
+        'script': 'scripts/integration/phase4_integration.py',
+        'type': 'continuous_service',
+        'dependencies': ('ensemble_system', 'regime_detector', 'model_registry'),
+        'critical': True,
+        'restart_policy': 'always',
+        'startup_delay': 15,
+        'health_check': 'controller_status'
+    },
+    'adaptive_learning': {
+        'script': 'scripts/ai/adaptive_learning.py',
+        'type': 'periodic_service',
+        'schedule': 'hourly',
+        'dependencies': ('model_registry',),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 20,
+        'health_check': 'learning_active'
+    },
+    
+    # Analysis & Optimization
+    'risk_optimizer': {
+        'script': 'scripts/analysis/risk_parameter_optimizer.py',
+        'type': 'scheduled_service',
+        'schedule': 'daily',
+        'dependencies': ('ai_server',),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 30,
+        'health_check': 'optimization_ready'
+    },
+    'postmortem_analyzer': {
+        'script': 'scripts/monitoring/trade_postmortem_analyzer.py',
+        'type': 'event_driven_service',
+        'dependencies': ('ai_server',),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 25,
+        'health_check': 'analyzer_ready'
+    },
+    'enhanced_trade_logger': {
+        'script': 'scripts/monitoring/enhanced_trade_logger.py',
+        'type': 'continuous_service',
+        'dependencies': ('ai_server',),
+        'critical': True,
+        'restart_policy': 'always',
+        'startup_delay': 8,
+        'health_check': 'logging_active'
+    },
+    
+    # Backtesting & Validation
+    'backtesting_system': {
+        'script': 'scripts/backtesting/comprehensive_backtester.py',
+        'type': 'on_demand_service',
+        'dependencies': ('phase4_controller',),
+        'critical': False,
+        'restart_policy': 'manual',
+        'startup_delay': 0,
+        'health_check': 'backtester_ready'
+    },
+    'backtesting_integration': {
+        'script': 'scripts/integration/backtesting_integration.py',
+        'type': 'scheduled_service',
+        'schedule': 'weekly',
+        'dependencies': ('backtesting_system', 'phase4_controller'),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 0,
+        'health_check': 'integration_ready'
+    },
+    
+    # Data & Model Management
+    'data_processor': {
+        'script': 'scripts/data/market_data_processor.py',
+        'type': 'scheduled_service',
+        'schedule': 'hourly',
+        'dependencies': (),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 0,
+        'health_check': 'data_pipeline_active'
+    },
+    'model_trainer': {
+        'script': 'scripts/training/automated_model_trainer.py',
+        'type': 'event_driven_service',
+        'dependencies': ('data_processor', 'model_registry'),
+        'critical': False,
+        'restart_policy': 'manual',
+        'startup_delay': 0,
+        'health_check': 'trainer_ready'
+    },
+    
+    # Research & Development Tools
+    'strategy_generator': {
+        'script': 'scripts/research/strategy_generator.py',
+        'type': 'on_demand_service',
+        'dependencies': ('data_processor',),
+        'critical': False,
+        'restart_policy': 'manual',
+        'startup_delay': 0,
+        'health_check': 'generator_ready'
+    },
+    'advanced_backtester': {
+        'script': 'scripts/research/advanced_backtester.py',
+        'type': 'on_demand_service',
+        'dependencies': ('strategy_generator',),
+        'critical': False,
+        'restart_policy': 'manual',
+        'startup_delay': 0,
+        'health_check': 'backtester_ready'
+    },
+    
+    # Integration & Monitoring
+    'server_integration_layer': {
+        'script': 'scripts/monitoring/server_integration_layer.py',
+        'type': 'continuous_service',
+        'dependencies': ('ai_server', 'enhanced_trade_logger'),
+        'critical': False,
+        'restart_policy': 'on_failure',
+        'startup_delay': 5,
+        'health_check': 'integration_active'
+    },
+    'system_analyzer': {
+        'script': 'scripts/analysis/current_system_analyzer.py',
+        'type': 'periodic_service',
+        'schedule': 'daily',
+        'dependencies': (),
+        'critical': False,
+        'restart_policy': 'manual',
+        'startup_delay': 0,
+        'health_check': 'analyzer_ready'
+    }
+}
 
 class EnhancedSystemOrchestrator:
+    # Status display grouping, resolved once instead of list scans per component
+    _CATEGORY_ORDER = (
+        "🔧 Core Services",
+        "🤖 AI Intelligence",
+        "📊 Analysis & Monitoring",
+        "🧪 Backtesting & Validation",
+    )
+    _CATEGORY_MAP: Dict[str, str] = {
+        'ai_server': "🔧 Core Services",
+        'performance_dashboard': "🔧 Core Services",
+        'model_registry': "🤖 AI Intelligence",
+        'ensemble_system': "🤖 AI Intelligence",
+        'regime_detector': "🤖 AI Intelligence",
+        'phase4_controller': "🤖 AI Intelligence",
+        'adaptive_learning': "🤖 AI Intelligence",
+        'risk_optimizer': "📊 Analysis & Monitoring",
+        'postmortem_analyzer': "📊 Analysis & Monitoring",
+        'enhanced_trade_logger': "📊 Analysis & Monitoring",
+        'backtesting_system': "🧪 Backtesting & Validation",
+        'backtesting_integration': "🧪 Backtesting & Validation",
+    }
+    _STATUS_EMOJI = {
+        'healthy': '✅',
+        'unhealthy': '⚠️ ',
+        'stopped': '❌',
+        'not_running': '⭕'
+    }
+    
     def __init__(self, interactive_setup=False):
         self.config = {}
         self.processes = {}
@@ -42,6 +279,17 @@ class EnhancedSystemOrchestrator:
         self.security_tokens = {}
         self.network_checks = {}
         self.health_history = {}
+        self._health_cache = {}  # component -> (timestamp, healthy) of last network probe
+        self._exit_events = queue.Queue()  # (component, process) pushed when a child exits
+        self._live_children: Set[str] = set()  # started children whose exit hasn't been handled yet
+        self._pending_restarts: Dict[str, float] = {}  # component -> monotonic time its restart is due
+        
+        # Keep-alive connection pool shared by all health probes, created on first probe
+        self._http = None
+        self._http_lock = threading.Lock()
+        
+        # Persistent pool used to start independent components concurrently
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='orchestrator')
         
         # Initialize base path and config file
         self.base_path = Path(r"G:\My Drive\AI_Gold_Scalper")
@@ -51,6 +299,9 @@ class EnhancedSystemOrchestrator:
         # Setup logging
         self.setup_logging()
         
+        # Per-instance copies so cached per-component fields stay isolated
+        self.components = {name: dict(spec) for name, spec in _COMPONENT_SPEC.items()}
+        
         if interactive_setup:
             self.interactive_setup()
         else:
@@ -58,192 +309,47 @@ class EnhancedSystemOrchestrator:
             # Check for missing OpenAI API key after loading config
             self.check_openai_api_key()
         
-        # Enhanced component configurations with full Phase 4 integration
-        self.components = {
-            # Core AI Infrastructure
-            'ai_server': {
-                'script': 'core/enhanced_ai_server_consolidated.py',
-                'port': 5000,
-                'health_endpoint': '/health',
-                'dependencies': ['model_registry'],
-                'type': 'service',
-                'critical': True,
-                'restart_policy': 'always',
-                'startup_delay': 0
-            },
-            'performance_dashboard': {
-                'script': 'scripts/monitoring/performance_dashboard.py',
-                'port': 8080,
-                'health_endpoint': '/api/system-status',
-                'dependencies': ['ai_server'],
-                'type': 'service',
-                'critical': True,
-                'restart_policy': 'always',
-                'startup_delay': 5
-            },
-            
-            # AI System Components
-            'model_registry': {
-                'script': 'scripts/ai/model_registry.py',
-                'type': 'persistent_service',
-                'dependencies': [],
-                'critical': True,
-                'restart_policy': 'always',
-                'startup_delay': 0,
-                'health_check': 'database_connection'
-            },
-            'ensemble_system': {
-                'script': 'scripts/ai/ensemble_models.py',
-                'type': 'on_demand_service',
-                'dependencies': ['model_registry'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 10,
-                'health_check': 'model_availability'
-            },
-            'regime_detector': {
-                'script': 'scripts/ai/market_regime_detector.py',
-                'type': 'continuous_service',
-                'dependencies': [],
-                'critical': False,
-                'restart_policy': 'always',
-                'startup_delay': 3,
-                'health_check': 'detection_active'
-            },
-            'phase4_controller': {
-                'script': 'scripts/integration/phase4_integration.py',
-                'type': 'continuous_service',
-                'dependencies': ['ensemble_system', 'regime_detector', 'model_registry'],
-                'critical': True,
-                'restart_policy': 'always',
-                'startup_delay': 15,
-                'health_check': 'controller_status'
-            },
-            'adaptive_learning': {
-                'script': 'scripts/ai/adaptive_learning.py',
-                'type': 'periodic_service',
-                'schedule': 'hourly',
-                'dependencies': ['model_registry'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 20,
-                'health_check': 'learning_active'
-            },
-            
-            # Analysis & Optimization
-            'risk_optimizer': {
-                'script': 'scripts/analysis/risk_parameter_optimizer.py',
-                'type': 'scheduled_service',
-                'schedule': 'daily',
-                'dependencies': ['ai_server'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 30,
-                'health_check': 'optimization_ready'
-            },
-            'postmortem_analyzer': {
-                'script': 'scripts/monitoring/trade_postmortem_analyzer.py',
-                'type': 'event_driven_service',
-                'dependencies': ['ai_server'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 25,
-                'health_check': 'analyzer_ready'
-            },
-            'enhanced_trade_logger': {
-                'script': 'scripts/monitoring/enhanced_trade_logger.py',
-                'type': 'continuous_service',
-                'dependencies': ['ai_server'],
-                'critical': True,
-                'restart_policy': 'always',
-                'startup_delay': 8,
-                'health_check': 'logging_active'
-            },
-            
-            # Backtesting & Validation
-            'backtesting_system': {
-                'script': 'scripts/backtesting/comprehensive_backtester.py',
-                'type': 'on_demand_service',
-                'dependencies': ['phase4_controller'],
-                'critical': False,
-                'restart_policy': 'manual',
-                'startup_delay': 0,
-                'health_check': 'backtester_ready'
-            },
-            'backtesting_integration': {
-                'script': 'scripts/integration/backtesting_integration.py',
-                'type': 'scheduled_service',
-                'schedule': 'weekly',
-                'dependencies': ['backtesting_system', 'phase4_controller'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 0,
-                'health_check': 'integration_ready'
-            },
-            
-            # Data & Model Management
-            'data_processor': {
-                'script': 'scripts/data/market_data_processor.py',
-                'type': 'scheduled_service',
-                'schedule': 'hourly',
-                'dependencies': [],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 0,
-                'health_check': 'data_pipeline_active'
-            },
-            'model_trainer': {
-                'script': 'scripts/training/automated_model_trainer.py',
-                'type': 'event_driven_service',
-                'dependencies': ['data_processor', 'model_registry'],
-                'critical': False,
-                'restart_policy': 'manual',
-                'startup_delay': 0,
-                'health_check': 'trainer_ready'
-            },
-            
-            # Research & Development Tools
-            'strategy_generator': {
-                'script': 'scripts/research/strategy_generator.py',
-                'type': 'on_demand_service',
-                'dependencies': ['data_processor'],
-                'critical': False,
-                'restart_policy': 'manual',
-                'startup_delay': 0,
-                'health_check': 'generator_ready'
-            },
-            'advanced_backtester': {
-                'script': 'scripts/research/advanced_backtester.py',
-                'type': 'on_demand_service',
-                'dependencies': ['strategy_generator'],
-                'critical': False,
-                'restart_policy': 'manual',
-                'startup_delay': 0,
-                'health_check': 'backtester_ready'
-            },
-            
-            # Integration & Monitoring
-            'server_integration_layer': {
-                'script': 'scripts/monitoring/server_integration_layer.py',
-                'type': 'continuous_service',
-                'dependencies': ['ai_server', 'enhanced_trade_logger'],
-                'critical': False,
-                'restart_policy': 'on_failure',
-                'startup_delay': 5,
-                'health_check': 'integration_active'
-            },
-            'system_analyzer': {
-                'script': 'scripts/analysis/current_system_analyzer.py',
-                'type': 'periodic_service',
-                'schedule': 'daily',
-                'dependencies': [],
-                'critical': False,
-                'restart_policy': 'manual',
-                'startup_delay': 0,
-                'health_check': 'analyzer_ready'
-            }
+        # Resolve script paths and stat them once; spawning and status checks reuse these
+        self._base_path_str = str(self.base_path)
+        for comp in self.components.values():
+            comp['_script_str'] = str(self.base_path / comp['script'])
+            comp['_script_exists'] = os.path.exists(comp['_script_str'])
+        
+        # Optional components whose scripts are absent
+        self._missing_optional = frozenset(
+            name for name, comp in self.components.items()
+            if comp.get('optional', False) and not comp['_script_exists']
+        )
+        self._startup_order_cache = None  # (deployment component set, ordered list)
+        
+        # Lookups used on every status build and monitor tick
+        self._critical_components = frozenset(
+            name for name, comp in self.components.items()
+            if comp.get('critical', False) and name not in self._missing_optional
+        )
+        self._service_ports = {name: comp['port'] for name, comp in self.components.items() if 'port' in comp}
+        
+        # Full dependency graph, computed once: shutdown walks it in reverse and a
+        # dying component looks up its dependents directly
+        self._topo_order = self._topological_sort(self.components.keys())
+        self._reverse_topo = list(reversed(self._topo_order))
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        for name, comp in self.components.items():
+            for dep in comp.get('dependencies', ()):
+                self._dependents[dep].append(name)
+        
+        # Per-component security tokens, derived from one random master key so startup
+        # needs a single getrandom() call instead of one per component
+        self._master_key = secrets.token_bytes(32)
+        self.security_tokens = {
+            name: hashlib.blake2b(name.encode(), key=self._master_key, digest_size=16).hexdigest()
+            for name in self.components
         }
         
+        # Persistent pool for I/O-bound health probes, fanned out once per status/monitor tick
+        self._probe_pool = ThreadPoolExecutor(max_workers=min(16, len(self.components)),
+                                              thread_name_prefix='health-probe')
+        
         self.setup_signal_handlers()
         if not interactive_setup:
             self.log_info("Enhanced System Orchestrator initialized")
@@ -640,7 +746,7 @@ class EnhancedSystemOrchestrator:
     def check_component_dependencies(self, component_name: str) -> bool:
         """Check if all dependencies for a component are running"""
         component = self.components.get(component_name, {})
-        dependencies = component.get('dependencies', [])
+        dependencies = component.get('dependencies', ())
         
         for dep in dependencies:
             if dep not in self.processes:
@@ -702,47 +808,58 @@ class EnhancedSystemOrchestrator:
     
     def get_startup_order(self) -> List[str]:
         """Get components in dependency order for startup"""
-        ordered = []
-        
         # Filter components based on deployment type
-        deployment_components = self.get_deployment_components()
+        deployment_components = frozenset(self.get_deployment_components())
+        if self._startup_order_cache and self._startup_order_cache[0] == deployment_components:
+            return list(self._startup_order_cache[1])
+        
         remaining = set(comp for comp in self.components.keys() if comp in deployment_components)
         
         self.log_info(f"Deployment type: {self.deployment_type}")
         self.log_info(f"Selected components: {sorted(remaining)}")
         
         # Remove optional components that don't exist
-        for comp_name in list(remaining):
-            component = self.components[comp_name]
-            if component.get('optional', False):
-                script_path = self.base_path / component['script']
-                if not script_path.exists():
-                    self.log_info(f"Optional component {comp_name} not found, skipping")
-                    remaining.remove(comp_name)
-        
-        while remaining:
-            # Find components with no unmet dependencies
-            ready = []
-            for comp_name in remaining:
-                deps = self.components[comp_name].get('dependencies', [])
-                if all(dep in ordered or dep not in remaining for dep in deps):
-                    ready.append(comp_name)
-            
-            if not ready:
-                # Circular dependency or missing dependency
-                self.log_error(f"Circular or missing dependencies detected: {remaining}")
-                break
-            
-            # Sort by startup delay
-            ready.sort(key=lambda x: self.components[x].get('startup_delay', 0))
-            
-            for comp_name in ready:
-                ordered.append(comp_name)
-                remaining.remove(comp_name)
+        for comp_name in sorted(remaining & self._missing_optional):
+            self.log_info(f"Optional component {comp_name} not found, skipping")
+            remaining.remove(comp_name)
+        
+        ordered = self._topological_sort(remaining)
+        self._startup_order_cache = (deployment_components, ordered)
+        return list(ordered)
+    
+    def _topological_sort(self, names) -> List[str]:
+        """Order components so dependencies come first (Kahn's algorithm, O(V+E))"""
+        names = set(names)
+        in_degree = defaultdict(int)
+        dependents = defaultdict(list)
+        for comp_name in names:
+            for dep in self.components[comp_name].get('dependencies', ()):
+                if dep in names:
+                    in_degree[comp_name] += 1
+                    dependents[dep].append(comp_name)
+        
+        def by_delay(batch):
+            return sorted(batch, key=lambda x: self.components[x].get('startup_delay', 0))
+        
+        ready = deque(by_delay(c for c in names if in_degree[c] == 0))
+        ordered = []
+        while ready:
+            comp_name = ready.popleft()
+            ordered.append(comp_name)
+            newly_ready = []
+            for dependent in dependents[comp_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    newly_ready.append(dependent)
+            ready.extend(by_delay(newly_ready))
+        
+        if len(ordered) < len(names):
+            # Circular dependency
+            self.log_error(f"Circular or missing dependencies detected: {names - set(ordered)}")
         
         return ordered
     
-    def start_component(self, component_name: str) -> bool:
+    def start_component(self, component_name: str, restart_count: int = 0) -> bool:
         """Start a specific component"""
         if component_name in self.processes:
             self.log_warning(f"Component {component_name} is already running")
@@ -753,14 +870,13 @@ class EnhancedSystemOrchestrator:
             self.log_error(f"Unknown component: {component_name}")
             return False
         
-        script_path = self.base_path / component['script']
-        if not script_path.exists():
-            if component.get('optional', False):
-                self.log_info(f"Optional component {component_name} not found, skipping")
-                return True
-            else:
-                self.log_error(f"Component script not found: {script_path}")
-                return False
+        if component_name in self._missing_optional:
+            self.log_info(f"Optional component {component_name} not found, skipping")
+            return True
+        
+        if not component['_script_exists']:
+            self.log_error(f"Component script not found: {component['_script_str']}")
+            return False
         
         # Check dependencies
         if not self.check_component_dependencies(component_name):
@@ -771,26 +887,46 @@ class EnhancedSystemOrchestrator:
         
         try:
             # Prepare command args based on component type
-            cmd_args = [sys.executable, str(script_path)]
+            cmd_args = [sys.executable, component['_script_str']]
             
             # Add service-specific arguments
             if component_name == 'model_registry':
                 cmd_args.append('--service')
             
-            process = subprocess.Popen(
-                cmd_args,
-                cwd=str(self.base_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            # Child output goes to a per-component log file; unread pipes would
+            # block the child once the OS pipe buffer fills
+            log_dir = self.base_path / 'logs' / 'components'
+            log_dir.mkdir(parents=True, exist_ok=True)
+            log_handle = open(log_dir / f'{component_name}.log', 'ab', buffering=0)
+            
+            try:
+                process = subprocess.Popen(
+                    cmd_args,
+                    cwd=self._base_path_str,
+                    stdout=log_handle,
+                    stderr=subprocess.STDOUT
+                )
+            except Exception:
+                log_handle.close()
+                raise
             
             self.processes[component_name] = {
                 'process': process,
+                'log_handle': log_handle,
                 'start_time': datetime.now(),
-                'restart_count': 0,
+                'restart_count': restart_count,
                 'component_info': component
             }
+            self._health_cache.pop(component_name, None)
+            self._live_children.add(component_name)
+            
+            # Report the exit as soon as it happens instead of waiting for the next poll
+            threading.Thread(
+                target=self._watch_process,
+                args=(component_name, process),
+                name=f"watch-{component_name}",
+                daemon=True
+            ).start()
             
             # Wait for startup delay
             startup_delay = component.get('startup_delay', 0)
@@ -803,16 +939,39 @@ class EnhancedSystemOrchestrator:
                 self.log_info(f"[OK] {component_name} started successfully (PID: {process.pid})")
                 return True
             else:
-                self.log_error(f"[ERROR] {component_name} failed to start")
-                del self.processes[component_name]
+                self.log_error(f"[ERROR] {component_name} failed to start "
+                               f"(see logs/components/{component_name}.log)")
+                self._forget_child(component_name)
+                self.processes.pop(component_name)['log_handle'].close()
                 return False
                 
         except Exception as e:
             self.log_error(f"Error starting {component_name}: {e}")
             return False
     
+    def _watch_process(self, component_name: str, process: subprocess.Popen):
+        """Block until a child exits and queue the event for the monitor loop"""
+        process.wait()
+        self._exit_events.put((component_name, process))
+    
+    def _get_http(self):
+        """Return the shared health-probe session, creating it on first use"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    _lazy_import()
+                    session = requests.Session()
+                    session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0))
+                    self._http = session
+        return self._http
+    
+    def _forget_child(self, component_name: str):
+        """Drop a component from the live set; its exit event, if any, is then ignored"""
+        self._live_children.discard(component_name)
+    
     def stop_component(self, component_name: str) -> bool:
         """Stop a specific component"""
+        self._pending_restarts.pop(component_name, None)
         if component_name not in self.processes:
             self.log_warning(f"Component {component_name} is not running")
             return True
@@ -836,6 +995,8 @@ class EnhancedSystemOrchestrator:
                 process.wait()
             
             del self.processes[component_name]
+            self._forget_child(component_name)
+            process_info['log_handle'].close()
             self.log_info(f"[OK] {component_name} stopped")
             return True
             
@@ -854,31 +1015,55 @@ class EnhancedSystemOrchestrator:
         
         # Check if process is still running
         if process.poll() is not None:
+            self._health_cache.pop(component_name, None)
             return False
         
-        # Check port availability for services
-        if 'port' in component:
+        if component_name not in self._service_ports:
+            return True
+        
+        # Network probes are expensive; reuse a recent result
+        cached = self._health_cache.get(component_name)
+        if cached and time.time() - cached[0] < HEALTH_CACHE_TTL_S:
+            return cached[1]
+        
+        healthy = self._probe_component(component_name, component)
+        self._health_cache[component_name] = (time.time(), healthy)
+        return healthy
+    
+    def check_components_health(self, component_names: List[str]) -> Dict[str, bool]:
+        """Health-check several components concurrently; probes still pending after the timeout count as unhealthy"""
+        futures = {name: self._probe_pool.submit(self.check_component_health, name)
+                   for name in component_names}
+        done, _ = wait(futures.values(), timeout=HEALTH_PROBE_TIMEOUT_S)
+        
+        results = {}
+        for name, future in futures.items():
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex(('localhost', component['port']))
-                sock.close()
-                if result != 0:
-                    return False
-            except Exception:
-                return False
+                results[name] = future in done and future.result()
+            except Exception as e:
+                self.log_error(f"Health check for {name} failed: {e}")
+                results[name] = False
+        return results
+    
+    def _probe_component(self, component_name: str, component: Dict) -> bool:
+        """Probe a service component's health endpoint, or its port if it has none"""
+        port = self._service_ports[component_name]
         
-        # Check health endpoint if available
-        if 'health_endpoint' in component and 'port' in component:
+        # A successful HTTP response already proves the port is open
+        if 'health_endpoint' in component:
             try:
-                url = f"http://localhost:{component['port']}{component['health_endpoint']}"
-                response = requests.get(url, timeout=5)
-                if response.status_code != 200:
-                    return False
+                url = f"http://localhost:{port}{component['health_endpoint']}"
+                response = self._get_http().get(url, timeout=5)
+                return response.status_code == 200
             except Exception:
                 return False
         
-        return True
+        # Port-only services: a loopback connect answers in microseconds, so keep the budget short
+        try:
+            socket.create_connection(('localhost', port), timeout=PORT_PROBE_TIMEOUT_S).close()
+            return True
+        except OSError:
+            return False
     
     def get_system_status(self) -> Dict:
         """Get comprehensive system status"""
@@ -891,37 +1076,36 @@ class EnhancedSystemOrchestrator:
                 'running_components': 0,
                 'healthy_components': 0,
                 'critical_components_running': 0,
-                'total_critical_components': 0
+                'total_critical_components': len(self._critical_components)
             }
         }
         
+        # Liveness comes from the exit events (no syscalls), then probe all running components at once
+        running = set(self._live_children)
+        health_results = self.check_components_health(list(running))
+        
         for component_name, component_config in self.components.items():
             # Skip optional components that don't exist
-            if component_config.get('optional', False):
-                script_path = self.base_path / component_config['script']
-                if not script_path.exists():
-                    continue
+            if component_name in self._missing_optional:
+                continue
             
             component_status = {
                 'type': component_config.get('type', 'unknown'),
-                'critical': component_config.get('critical', False),
-                'dependencies': component_config.get('dependencies', [])
+                'critical': component_name in self._critical_components,
+                'dependencies': component_config.get('dependencies', ())
             }
             
-            if component_config.get('critical', False):
-                status['summary']['total_critical_components'] += 1
-            
             if component_name in self.processes:
                 process_info = self.processes[component_name]
                 process = process_info['process']
                 
-                if process.poll() is None:
+                if component_name in running:
                     # Process is running
                     status['summary']['running_components'] += 1
-                    if component_config.get('critical', False):
+                    if component_name in self._critical_components:
                         status['summary']['critical_components_running'] += 1
                     
-                    health = self.check_component_health(component_name)
+                    health = health_results.get(component_name, False)
                     if health:
                         status['summary']['healthy_components'] += 1
                     
@@ -949,64 +1133,46 @@ class EnhancedSystemOrchestrator:
     def print_system_status(self):
         """Print formatted system status"""
         status = self.get_system_status()
-        
-        print("\n" + "="*70)
-        print("🚀 AI GOLD SCALPER - ENHANCED SYSTEM STATUS")
-        print("="*70)
-        
         summary = status['summary']
         
-        print(f"📊 System Summary:")
-        print(f"   • Deployment: {status['deployment_type']}")
-        print(f"   • Running: {summary['running_components']}/{summary['total_components']} components")
-        print(f"   • Healthy: {summary['healthy_components']}/{summary['running_components']} running components")
-        print(f"   • Critical: {summary['critical_components_running']}/{summary['total_critical_components']} critical components")
-        
-        print(f"\n🎯 Component Status:")
-        
-        # Group components by type
-        service_components = []
-        ai_components = []
-        analysis_components = []
-        backtesting_components = []
+        # Render the whole banner into one buffer and write it out once
+        buf = [
+            "",
+            "="*70,
+            "🚀 AI GOLD SCALPER - ENHANCED SYSTEM STATUS",
+            "="*70,
+            "📊 System Summary:",
+            f"   • Deployment: {status['deployment_type']}",
+            f"   • Running: {summary['running_components']}/{summary['total_components']} components",
+            f"   • Healthy: {summary['healthy_components']}/{summary['running_components']} running components",
+            f"   • Critical: {summary['critical_components_running']}/{summary['total_critical_components']} critical components",
+            "",
+            "🎯 Component Status:",
+        ]
         
+        # Group components by display category
+        grouped = {category: [] for category in self._CATEGORY_ORDER}
         for comp_name, comp_info in status['components'].items():
-            comp_type = comp_info.get('type', 'unknown')
-            if 'service' in comp_type and comp_name in ['ai_server', 'performance_dashboard']:
-                service_components.append((comp_name, comp_info))
-            elif comp_name in ['model_registry', 'ensemble_system', 'regime_detector', 'phase4_controller', 'adaptive_learning']:
-                ai_components.append((comp_name, comp_info))
-            elif comp_name in ['risk_optimizer', 'postmortem_analyzer', 'enhanced_trade_logger']:
-                analysis_components.append((comp_name, comp_info))
-            elif 'backtesting' in comp_name:
-                backtesting_components.append((comp_name, comp_info))
-        
-        # Display components by category
-        categories = [
-            ("🔧 Core Services", service_components),
-            ("🤖 AI Intelligence", ai_components),
-            ("📊 Analysis & Monitoring", analysis_components),
-            ("🧪 Backtesting & Validation", backtesting_components)
-        ]
+            category = self._CATEGORY_MAP.get(comp_name)
+            if category is not None:
+                grouped[category].append((comp_name, comp_info))
         
-        for category_name, components in categories:
+        for category_name in self._CATEGORY_ORDER:
+            components = grouped[category_name]
             if components:
-                print(f"\n{category_name}:")
+                buf.append("")
+                buf.append(f"{category_name}:")
                 for comp_name, comp_info in components:
-                    status_emoji = {
-                        'healthy': '✅',
-                        'unhealthy': '⚠️ ',
-                        'stopped': '❌',
-                        'not_running': '⭕'
-                    }.get(comp_info['status'], '❓')
-                    
+                    status_emoji = self._STATUS_EMOJI.get(comp_info['status'], '❓')
                     critical_indicator = " [CRITICAL]" if comp_info.get('critical', False) else ""
-                    print(f"   {status_emoji} {comp_name.upper()}: {comp_info['status']}{critical_indicator}")
+                    buf.append(f"   {status_emoji} {comp_name.upper()}: {comp_info['status']}{critical_indicator}")
                     
                     if 'pid' in comp_info:
-                        print(f"      PID: {comp_info['pid']} | Uptime: {comp_info['uptime']} | Restarts: {comp_info.get('restart_count', 0)}")
+                        buf.append(f"      PID: {comp_info['pid']} | Uptime: {comp_info['uptime']} | Restarts: {comp_info.get('restart_count', 0)}")
         
-        print("="*70)
+        buf.append("="*70)
+        sys.stdout.write('\n'.join(buf) + '\n')
+        sys.stdout.flush()
     
     def start_all(self) -> bool:
         """Start all components in dependency order"""
@@ -1029,21 +1195,51 @@ class EnhancedSystemOrchestrator:
         
         print(f"\n📋 Startup sequence: {len(startup_order)} components")
         
+        # Start components in dependency waves: everything whose dependencies are up
+        # starts concurrently, so startup time follows the critical path of the DAG
+        # rather than the sum of all startup delays.
+        startup_set = set(startup_order)
+        pending = list(startup_order)
+        started = set()
         failed_components = []
+        wave = 0
         
-        for i, component_name in enumerate(startup_order, 1):
-            component = self.components[component_name]
+        while pending:
+            ready = [
+                name for name in pending
+                if all(dep in started or dep not in startup_set
+                       for dep in self.components[name].get('dependencies', ()))
+            ]
+            
+            if not ready:
+                # Remaining components depend on something that failed to start
+                print(f"\n⚠️  Skipping components with failed dependencies: {', '.join(pending)}")
+                failed_components.extend(pending)
+                break
             
-            print(f"\n[{i}/{len(startup_order)}] Starting {component_name}...")
+            wave += 1
+            print(f"\n[Wave {wave}] Starting {', '.join(ready)}...")
+            for name in ready:
+                pending.remove(name)
             
-            if self.start_component(component_name):
-                startup_delay = component.get('startup_delay', 0)
-                if startup_delay > 0:
-                    print(f"   ⏱️  Waiting {startup_delay}s for initialization...")
-                    time.sleep(startup_delay)
-            else:
+            futures = {self._executor.submit(self.start_component, name): name for name in ready}
+            
+            for future in as_completed(futures):
+                component_name = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    self.log_error(f"Error starting {component_name}: {e}")
+                    success = False
+                
+                if success:
+                    started.add(component_name)
+                    continue
+                
                 failed_components.append(component_name)
-                if component.get('critical', False):
+                if component_name in self._critical_components:
+                    for other in futures:
+                        other.cancel()
                     print(f"   ❌ Critical component {component_name} failed to start!")
                     print("   🛑 Aborting startup due to critical component failure")
                     return False
@@ -1067,12 +1263,34 @@ class EnhancedSystemOrchestrator:
         """Stop all components in reverse order"""
         print("\n🛑 Stopping all components...")
         
-        # Stop in reverse dependency order
-        components = list(self.processes.keys())
-        components.reverse()
+        # Signal everything in reverse dependency order, then wait on all of them
+        # against one shared deadline so shutdown takes the slowest child, not the sum
+        to_stop = [c for c in self._reverse_topo if c in self.processes]
+        self._pending_restarts.clear()
+        for component_name in to_stop:
+            self.log_info(f"Stopping component: {component_name}")
+            try:
+                self.processes[component_name]['process'].terminate()
+            except Exception as e:
+                self.log_error(f"Error stopping {component_name}: {e}")
+        
+        deadline = time.monotonic() + 10
+        for component_name in to_stop:
+            process = self.processes[component_name]['process']
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                # Force kill if still running
+                self.log_warning(f"Force killing {component_name}")
+                process.kill()
+                process.wait()
+            except Exception as e:
+                self.log_error(f"Error stopping {component_name}: {e}")
         
-        for component_name in components:
-            self.stop_component(component_name)
+        for component_name in to_stop:
+            self._forget_child(component_name)
+            self.processes.pop(component_name)['log_handle'].close()
+            self.log_info(f"[OK] {component_name} stopped")
         
         print("✅ All components stopped")
     
@@ -1080,13 +1298,12 @@ class EnhancedSystemOrchestrator:
         """Restart a specific component"""
         print(f"🔄 Restarting {component_name}...")
         
-        if component_name in self.processes:
-            # Increment restart count
-            self.processes[component_name]['restart_count'] = self.processes[component_name].get('restart_count', 0) + 1
+        # Carry the count over to the new process entry
+        restart_count = self.processes.get(component_name, {}).get('restart_count', 0) + 1
         
         self.stop_component(component_name)
         time.sleep(2)
-        self.start_component(component_name)
+        self.start_component(component_name, restart_count=restart_count)
     
     def restart_all(self):
         """Restart all components"""
@@ -1095,52 +1312,106 @@ class EnhancedSystemOrchestrator:
         time.sleep(5)
         self.start_all()
     
+    def _apply_restart_policy(self, component_name: str) -> bool:
+        """Schedule a restart of a failed component per its policy; False if it stays failed"""
+        if component_name in self._pending_restarts:
+            return True
+        
+        process_info = self.processes[component_name]
+        restart_policy = process_info['component_info'].get('restart_policy', 'manual')
+        restart_count = process_info.get('restart_count', 0)
+        
+        if restart_policy == 'on_failure' and restart_count >= 3:  # Max 3 restart attempts
+            self.log_error(f"Component {component_name} exceeded restart limit")
+            return False
+        if restart_policy not in ('always', 'on_failure'):
+            return False
+        
+        # Back off exponentially so a crash-looping component is not respawned every tick
+        delay = min(2 ** min(restart_count, 10), RESTART_BACKOFF_MAX_S)
+        failed_at = process_info.setdefault('last_exit_time', time.monotonic())
+        self._pending_restarts[component_name] = failed_at + delay
+        self.log_info(f"Auto-restarting {component_name} in {delay}s "
+                      f"(policy: {restart_policy}, attempt {restart_count + 1})")
+        return True
+    
+    def _run_due_restarts(self):
+        """Restart components whose backoff delay has elapsed"""
+        now = time.monotonic()
+        for component_name, due in list(self._pending_restarts.items()):
+            if due <= now:
+                del self._pending_restarts[component_name]
+                self.restart_component(component_name)
+    
+    def _handle_exit(self, component_name: str) -> bool:
+        """React to a child exit once; False if the component stays failed"""
+        self._forget_child(component_name)
+        process_info = self.processes[component_name]
+        process_info['last_exit_time'] = time.monotonic()
+        process = process_info['process']
+        self.log_warning(f"Component {component_name} exited with code {process.returncode}")
+        # Dependents may be affected too: drop their cached health so they are re-probed
+        for dependent in self._dependents.get(component_name, ()):
+            self._health_cache.pop(dependent, None)
+        return self._apply_restart_policy(component_name)
+    
     def monitor_loop(self):
         """Enhanced monitoring loop with intelligent restart policies"""
         print("👁️  Starting enhanced monitoring loop...")
         
+        interval = max(MIN_MONITOR_INTERVAL_S,
+                       float(self.config.get('monitor_interval_s', DEFAULT_MONITOR_INTERVAL_S)))
+        next_check = time.monotonic()
+        
         while self.running:
             try:
                 failed_components = []
                 
-                # Check component health
-                for component_name in list(self.processes.keys()):
-                    if not self.check_component_health(component_name):
-                        component = self.processes[component_name]['component_info']
-                        restart_policy = component.get('restart_policy', 'manual')
-                        
-                        self.log_warning(f"Component {component_name} health check failed")
-                        
-                        if restart_policy == 'always':
-                            self.log_info(f"Auto-restarting {component_name} (policy: always)")
-                            self.restart_component(component_name)
-                        elif restart_policy == 'on_failure':
-                            restart_count = self.processes.get(component_name, {}).get('restart_count', 0)
-                            if restart_count < 3:  # Max 3 restart attempts
-                                self.log_info(f"Auto-restarting {component_name} (policy: on_failure, attempt {restart_count + 1})")
-                                self.restart_component(component_name)
-                            else:
-                                self.log_error(f"Component {component_name} exceeded restart limit")
-                                failed_components.append(component_name)
-                        else:
+                # React to process exits as they happen (pushed by watcher threads)
+                wake_at = min(next_check, *self._pending_restarts.values()) if self._pending_restarts else next_check
+                timeout = min(1.0, max(0.0, wake_at - time.monotonic()))
+                exits = []
+                try:
+                    exits.append(self._exit_events.get(timeout=timeout))
+                    while True:  # drain the backlog so the live set is current
+                        exits.append(self._exit_events.get_nowait())
+                except queue.Empty:
+                    pass
+                for component_name, process in exits:
+                    # Ignore exits of processes that were stopped, replaced or already handled
+                    if (self.processes.get(component_name, {}).get('process') is process
+                            and component_name in self._live_children):
+                        if not self._handle_exit(component_name):
                             failed_components.append(component_name)
+                        next_check = time.monotonic()
+                
+                self._run_due_restarts()
+                
+                # Periodic checks: network probes (cached per component) for the children
+                # still alive. Liveness is the set maintained from the watcher threads'
+                # exit events, so no per-child syscalls are needed.
+                if time.monotonic() >= next_check:
+                    next_check = time.monotonic() + interval
+                    health_results = self.check_components_health(list(self._live_children))
+                    for component_name, healthy in health_results.items():
+                        if not healthy and component_name in self.processes:
+                            self.log_warning(f"Component {component_name} health check failed")
+                            if not self._apply_restart_policy(component_name):
+                                failed_components.append(component_name)
                 
                 # Alert on critical component failures
                 if failed_components:
-                    critical_failed = [c for c in failed_components if self.components[c].get('critical', False)]
+                    critical_failed = [c for c in failed_components if c in self._critical_components]
                     if critical_failed:
                         self.log_error(f"CRITICAL ALERT: Critical components failed: {critical_failed}")
                         print(f"🚨 CRITICAL ALERT: {critical_failed} components failed!")
                 
-                # Sleep for monitoring interval
-                time.sleep(30)
-                
             except KeyboardInterrupt:
                 print("\n🛑 Monitoring interrupted by user")
                 break
             except Exception as e:
                 self.log_error(f"Error in monitoring loop: {e}")
-                time.sleep(30)
+                time.sleep(MIN_MONITOR_INTERVAL_S)
     
     def run_backtesting(self, symbol: str = "XAUUSD", strategy: str = "ai_model"):
         """Run backtesting system"""
@@ -1189,6 +1460,10 @@ class EnhancedSystemOrchestrator:
         """Graceful shutdown"""
         self.running = False
         self.stop_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
+        if self._http is not None:
+            self._http.close()
         print("🏁 System shutdown complete")
 
 def main():
@@ -705,7 +705,7 @@ class TradingDashboard:
                             'price': latest_tick.last,
                             'bid': latest_tick.bid,
                             'ask': latest_tick.ask,
-                            'timestamp': latest_tick.timestamp.isoformat()
+                            'timestamp': latest_tick.as_datetime().isoformat()
                         }
                         self.socketio.emit('market_update', market_update)
                 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+AI Gold Scalper - Market Data Compute Kernels
+
+Per-tick numeric kernels for the market data processor. They take raw NumPy
+arrays and plain scalars so Numba can compile them to machine code; without
+Numba they run as ordinary Python with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Layout of the 7-element float64 running bar state
+BAR_OPEN, BAR_HIGH, BAR_LOW, BAR_CLOSE, BAR_VOLUME, BAR_COUNT, BAR_BUCKET = range(7)
+BAR_STATE_SIZE = 7
+
+# update_bar results
+BAR_UPDATED = 0
+BAR_OPENED = 1
+BAR_LATE = -1
+
+def new_bar_state() -> np.ndarray:
+    """Return an empty running bar state (tick count 0)"""
+    return np.zeros(BAR_STATE_SIZE, dtype=np.float64)
+
+@njit(cache=True, fastmath=True)
+def update_bar(bar_state, last, vol, bucket):
+    """Fold one tick into a running bar in place.
+
+    Opens a new bar when the state is empty or the tick belongs to a later
+    minute, and ignores ticks for a minute the bar has already rolled past.
+    """
+    if bar_state[BAR_COUNT] == 0 or bucket > bar_state[BAR_BUCKET]:
+        bar_state[BAR_OPEN] = last
+        bar_state[BAR_HIGH] = last
+        bar_state[BAR_LOW] = last
+        bar_state[BAR_CLOSE] = last
+        bar_state[BAR_VOLUME] = vol
+        bar_state[BAR_COUNT] = 1
+        bar_state[BAR_BUCKET] = bucket
+        return BAR_OPENED
+
+    if bucket < bar_state[BAR_BUCKET]:
+        return BAR_LATE
+
+    if last > bar_state[BAR_HIGH]:
+        bar_state[BAR_HIGH] = last
+    if last < bar_state[BAR_LOW]:
+        bar_state[BAR_LOW] = last
+    bar_state[BAR_CLOSE] = last
+    bar_state[BAR_VOLUME] += vol
+    bar_state[BAR_COUNT] += 1
+    return BAR_UPDATED
+
+@njit(cache=True, fastmath=True)
+def window_min_max(values):
+    """Return (min, max) of a non-empty 1-D array in a single pass"""
+    lo = values[0]
+    hi = values[0]
+    for i in range(1, values.shape[0]):
+        v = values[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+@njit(cache=True)
+def rolling_min_max(values, window):
+    """Rolling min and max over a trailing window, O(n) via monotonic deques.
+
+    Entries before the first full window cover the values seen so far.
+    """
+    n = values.shape[0]
+    out_min = np.empty(n, dtype=values.dtype)
+    out_max = np.empty(n, dtype=values.dtype)
+    min_idx = np.empty(n, dtype=np.int64)
+    max_idx = np.empty(n, dtype=np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+
+    for i in range(n):
+        v = values[i]
+
+        while min_tail > min_head and values[min_idx[min_tail - 1]] >= v:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+
+        while max_tail > max_head and values[max_idx[max_tail - 1]] <= v:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+
+        out_min[i] = values[min_idx[min_head]]
+        out_max[i] = values[max_idx[max_head]]
+
+    return out_min, out_max
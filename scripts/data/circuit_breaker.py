@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+AI Gold Scalper - Circuit Breaker
+
+Consecutive-failure circuit breaker shared by the market data sources. Kept
+free of the trading stack's heavy imports so it can be used and tested alone.
+"""
+
+import logging
+import time
+
+class CircuitBreaker:
+    """Take a failing component out of rotation for a doubling cooldown.
+
+    max_errors consecutive failures open the circuit for cooldown_seconds; each
+    repeated trip doubles the cooldown up to max_cooldown_seconds. A success
+    closes the circuit and resets the backoff.
+    """
+
+    def __init__(self, name: str, max_errors: int = 5, cooldown_seconds: float = 30.0,
+                 max_cooldown_seconds: float = 600.0):
+        self.name = name
+        self.error_count = 0
+        self.max_errors = max_errors
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self._cooldown_until = 0.0  # time.monotonic() deadline
+        self._trip_count = 0
+
+    def record_success(self):
+        """Close the circuit and reset the backoff"""
+        self.error_count = 0
+        self._trip_count = 0
+
+    def record_error(self):
+        """Count a failure and open the circuit after max_errors in a row"""
+        self.error_count += 1
+        if self.error_count >= self.max_errors:
+            cooldown = min(self.cooldown_seconds * 2 ** self._trip_count, self.max_cooldown_seconds)
+            self._cooldown_until = time.monotonic() + cooldown
+            self._trip_count += 1
+            self.error_count = 0
+            logging.warning(f"{self.name} failing, skipping it for {cooldown:.0f}s")
+
+    def in_cooldown(self) -> bool:
+        """True while the circuit is open"""
+        return time.monotonic() < self._cooldown_until
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until the circuit closes again (0 when closed)"""
+        return max(0.0, self._cooldown_until - time.monotonic())
@@ -16,31 +16,55 @@ Features:
 """
 
 import asyncio
-import json
 import logging
 import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable, ClassVar
 import yfinance as yf
 import sqlite3
 import threading
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, replace
+from collections import deque
 from pathlib import Path
-import requests
+import aiohttp
+import orjson
 from concurrent.futures import ThreadPoolExecutor
 import websocket
 import ssl
 import talib
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
-@dataclass
+sys.path.append(str(Path(__file__).parent))
+from circuit_breaker import CircuitBreaker
+from _kernels import (
+    BAR_OPEN, BAR_HIGH, BAR_LOW, BAR_CLOSE, BAR_VOLUME, BAR_COUNT, BAR_BUCKET,
+    BAR_OPENED, BAR_LATE, new_bar_state, update_bar, window_min_max
+)
+
+MINUTE_US = 60_000_000
+DAY_US = 86_400_000_000
+MINUTES_PER_DAY = 1440
+OHLC_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'tick_count']
+# In-memory OHLC dtypes: float32 keeps ~7 significant digits, ample for XAUUSD
+# quotes, at half the memory traffic of float64
+OHLC_DTYPES = {
+    'open': 'float32', 'high': 'float32', 'low': 'float32', 'close': 'float32',
+    'volume': 'int32', 'tick_count': 'int32'
+}
+
+def now_us() -> int:
+    """Current wall-clock time as integer microseconds since the epoch"""
+    return time.time_ns() // 1000
+
+@dataclass(slots=True)
 class MarketTick:
     """Market tick data structure"""
     symbol: str
-    timestamp: datetime
+    timestamp: int  # microseconds since the epoch
     bid: float
     ask: float
     last: float
@@ -49,17 +73,62 @@ class MarketTick:
     low: float
     open: float
     close: float
+    # Set once the tick is handed outside the processor (callbacks, source caches);
+    # shared ticks are never recycled since someone else may still read them
+    _shared: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    # Free list of recycled instances, sized to one tick ring buffer
+    _pool: ClassVar[List['MarketTick']] = []
+    _pool_max: ClassVar[int] = 4096
+    
+    @classmethod
+    def acquire(cls, symbol: str, timestamp: int, bid: float, ask: float, last: float,
+                volume: int, high: float, low: float, open: float, close: float) -> 'MarketTick':
+        """Get a tick from the pool, allocating only when it is empty"""
+        if not cls._pool:
+            return cls(symbol, timestamp, bid, ask, last, volume, high, low, open, close)
+        tick = cls._pool.pop()
+        tick._shared = False
+        tick.symbol = symbol
+        tick.timestamp = timestamp
+        tick.bid = bid
+        tick.ask = ask
+        tick.last = last
+        tick.volume = volume
+        tick.high = high
+        tick.low = low
+        tick.open = open
+        tick.close = close
+        return tick
+    
+    def as_datetime(self) -> datetime:
+        """Tick time as a local datetime, for display and persistence"""
+        return datetime.fromtimestamp(self.timestamp / 1_000_000)
+    
+    def share(self) -> 'MarketTick':
+        """Mark the tick as referenced outside the processor so it is never recycled"""
+        self._shared = True
+        return self
+    
+    def release(self):
+        """Return the tick to the pool unless it has been shared"""
+        if not self._shared and len(MarketTick._pool) < MarketTick._pool_max:
+            MarketTick._pool.append(self)
 
-class DataSource:
+class DataSource(CircuitBreaker):
     """Base class for market data sources"""
     
+    # Streaming sources push ticks through tick_sink instead of being polled
+    is_streaming = False
+    
     def __init__(self, name: str, priority: int = 1):
-        self.name = name
+        # Circuit breaker: max_errors consecutive failures take the source out of
+        # rotation for a cooldown that doubles per repeated trip
+        super().__init__(name)
         self.priority = priority
         self.is_connected = False
-        self.last_update = None
-        self.error_count = 0
-        self.max_errors = 5
+        self.last_update: Optional[int] = None  # microseconds since the epoch
+        self.tick_sink: Optional[Callable[[MarketTick], None]] = None
     
     async def connect(self) -> bool:
         """Connect to data source"""
@@ -73,13 +142,17 @@ class DataSource:
         """Get latest tick data"""
         raise NotImplementedError
     
+    def is_available(self) -> bool:
+        """Check if the source may be polled; retried once its cooldown expires"""
+        return self.is_connected and not self.in_cooldown()
+    
     def is_healthy(self) -> bool:
         """Check if data source is healthy"""
         return (
             self.is_connected and 
-            self.error_count < self.max_errors and
+            not self.in_cooldown() and
             self.last_update and
-            (datetime.now() - self.last_update).seconds < 300  # 5 minutes
+            now_us() - self.last_update < 300_000_000  # 5 minutes
         )
 
 class YahooFinanceSource(DataSource):
@@ -87,62 +160,71 @@ class YahooFinanceSource(DataSource):
     
     def __init__(self):
         super().__init__("YahooFinance", priority=2)
-        self.session = requests.Session()
+        self._symbol_map = {"XAUUSD": "GC=F"}
+        self._columns = ('Open', 'High', 'Low', 'Close', 'Volume')
+        self._col_idx: Optional[Tuple[Optional[int], ...]] = None  # positions of _columns, resolved on first download
     
     async def connect(self) -> bool:
         """Connect to Yahoo Finance"""
         try:
             # Test connection
-            test_data = yf.download("GC=F", period="1d", interval="1m", progress=False)
+            test_data = await asyncio.to_thread(yf.download, "GC=F", period="1d", interval="1m", progress=False)
             if not test_data.empty:
                 self.is_connected = True
-                self.last_update = datetime.now()
+                self.last_update = now_us()
                 logging.info("Yahoo Finance data source connected")
                 return True
         except Exception as e:
             logging.error(f"Yahoo Finance connection failed: {e}")
-            self.error_count += 1
+            self.record_error()
         return False
     
     async def disconnect(self):
         """Disconnect from Yahoo Finance"""
         self.is_connected = False
-        self.session.close()
     
     async def get_tick(self, symbol: str) -> Optional[MarketTick]:
         """Get latest tick from Yahoo Finance"""
         try:
             # Map symbol
-            yf_symbol = "GC=F" if symbol == "XAUUSD" else symbol
+            yf_symbol = self._symbol_map.get(symbol, symbol)
             
             # Get latest data
-            data = yf.download(yf_symbol, period="1d", interval="1m", progress=False)
+            # yfinance is blocking; run it off the event loop so other sources can race it
+            data = await asyncio.to_thread(yf.download, yf_symbol, period="1d", interval="1m", progress=False)
             if data.empty:
                 return None
             
-            latest = data.iloc[-1]
-            now = datetime.now()
+            # Read the last row positionally instead of by label
+            if self._col_idx is None:
+                self._col_idx = tuple(
+                    data.columns.get_loc(c) if c in data.columns else None for c in self._columns
+                )
+            latest = data.to_numpy()[-1]
+            op, hi, lo, cl = (float(latest[i]) for i in self._col_idx[:4])
+            vol_idx = self._col_idx[4]
+            now = now_us()
             
-            tick = MarketTick(
+            tick = MarketTick.acquire(
                 symbol=symbol,
                 timestamp=now,
-                bid=float(latest['Close']) - 0.1,  # Approximate bid
-                ask=float(latest['Close']) + 0.1,  # Approximate ask
-                last=float(latest['Close']),
-                volume=int(latest['Volume']) if 'Volume' in latest else 0,
-                high=float(latest['High']),
-                low=float(latest['Low']),
-                open=float(latest['Open']),
-                close=float(latest['Close'])
+                bid=cl - 0.1,  # Approximate bid
+                ask=cl + 0.1,  # Approximate ask
+                last=cl,
+                volume=int(latest[vol_idx]) if vol_idx is not None else 0,
+                high=hi,
+                low=lo,
+                open=op,
+                close=cl
             )
             
             self.last_update = now
-            self.error_count = 0
+            self.record_success()
             return tick
             
         except Exception as e:
             logging.error(f"Yahoo Finance tick error: {e}")
-            self.error_count += 1
+            self.record_error()
             return None
 
 class AlphaVantageSource(DataSource):
@@ -152,78 +234,229 @@ class AlphaVantageSource(DataSource):
         super().__init__("AlphaVantage", priority=1)
         self.api_key = api_key
         self.base_url = "https://www.alphavantage.co/query"
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.request_timeout = 2.0  # seconds; a stalled request counts as a failure
+        self._symbol_map = {"XAUUSD": "GC=F"}
+        self._fields = ('05. price', '06. volume', '03. high', '04. low', '02. open', '08. previous close')
+    
+    async def _get_quote(self, av_symbol: str) -> Tuple[int, Any]:
+        """Fetch GLOBAL_QUOTE over the pooled session; returns (status, parsed body)"""
+        params = {
+            'function': 'GLOBAL_QUOTE',
+            'symbol': av_symbol,
+            'apikey': self.api_key
+        }
+        return await asyncio.wait_for(self._fetch(params), self.request_timeout)
+    
+    async def _fetch(self, params: Dict[str, str]) -> Tuple[int, Any]:
+        """Issue one request and read the whole body"""
+        async with self.session.get(self.base_url, params=params) as response:
+            body = await response.read()
+            return response.status, orjson.loads(body) if response.status == 200 else None
     
     async def connect(self) -> bool:
         """Connect to Alpha Vantage"""
         try:
-            # Test API connection
-            params = {
-                'function': 'GLOBAL_QUOTE',
-                'symbol': 'GC=F',
-                'apikey': self.api_key
-            }
+            # One keep-alive session for all requests
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
             
-            response = requests.get(self.base_url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            # Test API connection
+            status, data = await self._get_quote('GC=F')
+            if status == 200:
                 if 'Global Quote' in data:
                     self.is_connected = True
-                    self.last_update = datetime.now()
+                    self.last_update = now_us()
                     logging.info("Alpha Vantage data source connected")
                     return True
         except Exception as e:
             logging.error(f"Alpha Vantage connection failed: {e}")
-            self.error_count += 1
+            self.record_error()
         return False
     
     async def disconnect(self):
         """Disconnect from Alpha Vantage"""
         self.is_connected = False
+        if self.session:
+            await self.session.close()
+            self.session = None
     
     async def get_tick(self, symbol: str) -> Optional[MarketTick]:
         """Get latest tick from Alpha Vantage"""
         try:
             # Map symbol for Alpha Vantage
-            av_symbol = "GC=F" if symbol == "XAUUSD" else symbol
-            
-            params = {
-                'function': 'GLOBAL_QUOTE',
-                'symbol': av_symbol,
-                'apikey': self.api_key
-            }
+            av_symbol = self._symbol_map.get(symbol, symbol)
             
-            response = requests.get(self.base_url, params=params, timeout=10)
-            if response.status_code != 200:
-                raise Exception(f"API error: {response.status_code}")
+            status, data = await self._get_quote(av_symbol)
+            if status != 200:
+                raise Exception(f"API error: {status}")
             
-            data = response.json()
             if 'Global Quote' not in data:
                 raise Exception("Invalid API response")
             
             quote = data['Global Quote']
-            now = datetime.now()
+            price, volume, high, low, open_, prev_close = map(float, (quote[f] for f in self._fields))
+            now = now_us()
             
-            tick = MarketTick(
+            tick = MarketTick.acquire(
                 symbol=symbol,
                 timestamp=now,
-                bid=float(quote['05. price']) - 0.1,
-                ask=float(quote['05. price']) + 0.1,
-                last=float(quote['05. price']),
-                volume=int(quote['06. volume']),
-                high=float(quote['03. high']),
-                low=float(quote['04. low']),
-                open=float(quote['02. open']),
-                close=float(quote['08. previous close'])
+                bid=price - 0.1,
+                ask=price + 0.1,
+                last=price,
+                volume=int(volume),
+                high=high,
+                low=low,
+                open=open_,
+                close=prev_close
             )
             
             self.last_update = now
-            self.error_count = 0
+            self.record_success()
             return tick
             
         except Exception as e:
             logging.error(f"Alpha Vantage tick error: {e}")
-            self.error_count += 1
+            self.record_error()
+            return None
+
+class WebsocketSource(DataSource):
+    """Streaming websocket data source; quotes are pushed as they arrive"""
+    
+    is_streaming = True
+    
+    def __init__(self, url: str, name: str = "Websocket", priority: int = 0,
+                 subscribe_message: Optional[Dict[str, Any]] = None,
+                 symbol_map: Optional[Dict[str, str]] = None):
+        super().__init__(name, priority=priority)
+        self.url = url
+        self.subscribe_message = subscribe_message
+        self.symbol_map = symbol_map or {}  # feed symbol -> internal symbol
+        self.reconnect_delay = 1.0  # seconds, doubled per failed attempt up to 60s
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._latest: Dict[str, MarketTick] = {}
+    
+    async def connect(self) -> bool:
+        """Open the websocket and start the reader task"""
+        try:
+            self.session = aiohttp.ClientSession()
+            await self._open()
+            self.is_connected = True
+            self.last_update = now_us()
+            self._reader_task = asyncio.create_task(self._reader_loop())
+            logging.info(f"{self.name} websocket connected")
+            return True
+        except Exception as e:
+            logging.error(f"{self.name} websocket connection failed: {e}")
+            self.record_error()
+            if self.session:
+                await self.session.close()
+                self.session = None
+        return False
+    
+    async def _open(self):
+        """Connect and subscribe"""
+        # Pings are answered by the reader loop itself; no message size cap
+        self.ws = await self.session.ws_connect(self.url, autoping=False, max_msg_size=0)
+        if self.subscribe_message:
+            await self.ws.send_str(orjson.dumps(self.subscribe_message).decode())
+    
+    async def disconnect(self):
+        """Stop the reader and close the websocket"""
+        self.is_connected = False
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
+        if self.session:
+            await self.session.close()
+            self.session = None
+    
+    async def _reader_loop(self):
+        """Receive messages, push ticks, and reconnect with backoff when the socket drops"""
+        delay = self.reconnect_delay
+        while self.is_connected:
+            try:
+                async for msg in self.ws:
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        # A malformed frame is skipped; it doesn't warrant a reconnect
+                        try:
+                            tick = self.parse_message(orjson.loads(msg.data))
+                        except (ValueError, TypeError, KeyError) as e:
+                            logging.warning(f"{self.name} skipped malformed message: {e}")
+                            continue
+                        if tick:
+                            self.last_update = tick.timestamp
+                            self.record_success()
+                            self._latest[tick.symbol] = tick.share()
+                            if self.tick_sink:
+                                self.tick_sink(tick)
+                    elif msg.type == aiohttp.WSMsgType.PING:
+                        await self.ws.pong(msg.data)
+                    elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"{self.name} websocket error: {e}")
+                self.record_error()
+            
+            # Socket closed (or errored): release it, then reconnect until stopped
+            if self.ws is not None and not self.ws.closed:
+                try:
+                    await self.ws.close()
+                except Exception as e:
+                    logging.debug(f"{self.name} websocket close failed: {e}")
+            
+            while self.is_connected:
+                await asyncio.sleep(delay)
+                try:
+                    await self._open()
+                    delay = self.reconnect_delay
+                    logging.info(f"{self.name} websocket reconnected")
+                    break
+                except Exception as e:
+                    logging.error(f"{self.name} websocket reconnect failed: {e}")
+                    self.record_error()
+                    delay = min(delay * 2, 60.0)
+    
+    def parse_message(self, data: Any) -> Optional[MarketTick]:
+        """Convert a feed message into a tick; override for feed-specific formats.
+        
+        The default expects {"symbol", "bid", "ask", "price"|"last", "volume"}.
+        """
+        if not isinstance(data, dict) or 'symbol' not in data:
             return None
+        
+        feed_symbol = data['symbol']
+        last = float(data.get('price', data.get('last', 0.0)))
+        bid = float(data.get('bid', last))
+        ask = float(data.get('ask', last))
+        
+        return MarketTick.acquire(
+            symbol=self.symbol_map.get(feed_symbol, feed_symbol),
+            timestamp=now_us(),
+            bid=bid,
+            ask=ask,
+            last=last,
+            volume=int(data.get('volume', 0)),
+            high=last,
+            low=last,
+            open=last,
+            close=last
+        )
+    
+    async def get_tick(self, symbol: str) -> Optional[MarketTick]:
+        """Latest pushed tick for symbol"""
+        return self._latest.get(symbol)
 
 @dataclass
 class TechnicalIndicators:
@@ -366,17 +599,68 @@ class MarketDataProcessor:
         
         # Processing
         self.symbols = ["XAUUSD"]  # Gold
-        self.tick_buffer: Dict[str, List[MarketTick]] = {}
+        # Fixed-size ring buffers per symbol: recent tick objects, plus column arrays
+        # (timestamp/last/volume) for vectorized analysis of recent ticks. Prices and
+        # volumes are kept as float32/int32; timestamps need int64 microseconds.
+        self.tick_buffer_capacity = 4096
+        self.tick_buffer: Dict[str, deque] = {}
+        self.tick_soa: Dict[str, Dict[str, Any]] = {}
+        # Running 1-minute bar state per symbol (see _kernels.BAR_*), updated in
+        # O(1) per tick and closed by a timer at each minute boundary
+        self.current_bar: Dict[str, np.ndarray] = {}
+        self._bar_timestamp: Dict[str, datetime] = {}
+        self._closed_bucket: Dict[str, int] = {}  # last closed minute per symbol
+        self._minute_timer: Optional[asyncio.TimerHandle] = None
+        self._minute_timer_bucket = 0  # minute that starts when the timer fires
         self.processed_data: Dict[str, pd.DataFrame] = {}
         
         # State
         self.is_running = False
-        self.processing_thread = None
+        self.processing_task: Optional[asyncio.Task] = None
         self.update_interval = 1.0  # seconds
+        self.source_timeout = 10.0  # seconds to wait for any polled source to answer
+        
+        # Ingestion pipeline: producers -> tick_queue -> persist -> aggregate.
+        # When tick_queue is full the oldest tick is dropped so producers never block.
+        self.tick_queue_size = 10_000
+        self.tick_queue: Optional[asyncio.Queue] = None
+        self._aggregate_queue: Optional[asyncio.Queue] = None
+        self.dropped_ticks = 0
+        
+        # Write batching: ticks and OHLC upserts are committed together every
+        # write_batch_size ticks or write_flush_interval seconds
+        self.write_batch_size = 128
+        self.write_flush_interval = 1.0  # seconds
+        self._write_lock = threading.Lock()  # guards the write buffers
+        self._db_lock = threading.Lock()  # guards the shared connection
+        self._tick_write_buf: List[tuple] = []
+        self.max_pending_ticks = 100_000  # cap on ticks kept for retry while writes fail
+        self._ohlc_write_buf: Dict[Tuple[str, datetime], tuple] = {}
+        self._last_flush = time.monotonic()
+        
+        # Ticks are written to one table per UTC day (ticks_YYYYMMDD) so each index
+        # stays small and expired days are dropped whole
+        self.tick_retention_days = 7
+        self._tick_insert_sql: Dict[int, str] = {}  # UTC day number -> INSERT text
+        
+        # L1 cache for get_ohlc_data: (symbol, periods) -> (frame, valid_until_us, generation).
+        # Every flush that writes bars (including each minute close) bumps the write
+        # generation, so entries read before it are never served or stored; the TTL
+        # only bounds staleness if a flush is ever missed.
+        self.ohlc_cache_ttl = 300  # seconds
+        self._ohlc_cache: Dict[Tuple[str, int], Tuple[pd.DataFrame, int, int]] = {}
+        self._ohlc_generation = 0  # bumped under _db_lock on each committed bar write
         
         # Callbacks
         self.tick_callbacks = []
         self.ohlc_callbacks = []
+        # Frozen views used on the hot path, rebuilt on registration. Coroutine
+        # callbacks run as their own tasks so slow subscribers can't stall aggregation.
+        self._tick_callbacks_t: Tuple[Callable, ...] = ()
+        self._tick_async_callbacks_t: Tuple[Callable, ...] = ()
+        self._ohlc_callbacks_t: Tuple[Callable, ...] = ()
+        self._ohlc_async_callbacks_t: Tuple[Callable, ...] = ()
+        self._background_tasks: set = set()
         
         # Initialize database
         self._init_database()
@@ -384,9 +668,39 @@ class MarketDataProcessor:
         logging.info("Market Data Processor initialized")
     
     def _init_database(self):
-        """Initialize SQLite database"""
+        """Initialize SQLite database and open the persistent write connection"""
+        self._conn = None
+        
+        # Write statements are built once; sqlite3 keeps them prepared in the
+        # connection's statement cache, keyed by this exact text. Tick inserts are
+        # built per day partition from this template.
+        self._insert_tick_sql = (
+            "INSERT INTO {table} (symbol, timestamp, bid, ask, last, volume, high, low, open, close) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        # OHLC bars are staged in a temp table and merged with one upsert per flush;
+        # DO UPDATE rewrites the row in place where INSERT OR REPLACE deletes and reinserts
+        self._stage_ohlc_sql = (
+            "INSERT INTO ohlc_1m_stage (symbol, timestamp, open, high, low, close, volume, tick_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        self._merge_ohlc_sql = (
+            "INSERT INTO ohlc_1m (symbol, timestamp, open, high, low, close, volume, tick_count) "
+            "SELECT symbol, timestamp, open, high, low, close, volume, tick_count FROM ohlc_1m_stage WHERE true "
+            "ON CONFLICT(symbol, timestamp) DO UPDATE SET "
+            "open = excluded.open, high = excluded.high, low = excluded.low, close = excluded.close, "
+            "volume = excluded.volume, tick_count = excluded.tick_count"
+        )
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # Autocommit mode; batches are wrapped in explicit BEGIN/COMMIT
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            
+            with self._db_lock:
+                conn = self._conn
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS ticks (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -409,6 +723,9 @@ class MarketDataProcessor:
                     ON ticks(symbol, timestamp)
                 """)
                 
+                self._ensure_tick_partition(now_us() // DAY_US)
+                self._drop_expired_tick_partitions()
+                
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS ohlc_1m (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -425,13 +742,83 @@ class MarketDataProcessor:
                     )
                 """)
                 
-                conn.commit()
+                conn.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS ohlc_1m_stage (
+                        symbol TEXT NOT NULL,
+                        timestamp DATETIME NOT NULL,
+                        open REAL NOT NULL,
+                        high REAL NOT NULL,
+                        low REAL NOT NULL,
+                        close REAL NOT NULL,
+                        volume INTEGER DEFAULT 0,
+                        tick_count INTEGER DEFAULT 0
+                    )
+                """)
+                
                 logging.info("Database initialized successfully")
         except Exception as e:
             logging.error(f"Database initialization failed: {e}")
     
+    @staticmethod
+    def _tick_table(day: int) -> str:
+        """Name of the tick partition for a UTC day number"""
+        return "ticks_" + time.strftime('%Y%m%d', time.gmtime(day * 86400))
+    
+    def _ensure_tick_partition(self, day: int) -> str:
+        """Create a day's tick table if needed and return its INSERT text (caller holds _db_lock)"""
+        sql = self._tick_insert_sql.get(day)
+        if sql is None:
+            table = self._tick_table(day)
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    symbol TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    bid REAL NOT NULL,
+                    ask REAL NOT NULL,
+                    last REAL NOT NULL,
+                    volume INTEGER DEFAULT 0,
+                    high REAL NOT NULL,
+                    low REAL NOT NULL,
+                    open REAL NOT NULL,
+                    close REAL NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self._conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_symbol_time
+                ON {table}(symbol, timestamp)
+            """)
+            sql = self._tick_insert_sql[day] = self._insert_tick_sql.format(table=table)
+        return sql
+    
+    def _drop_expired_tick_partitions(self):
+        """Drop tick partitions older than tick_retention_days (caller holds _db_lock)"""
+        cutoff = now_us() // DAY_US - self.tick_retention_days
+        oldest = self._tick_table(cutoff)
+        rows = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB 'ticks_[0-9]*'"
+        ).fetchall()
+        for (table,) in rows:
+            if table < oldest:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                logging.info(f"Dropped expired tick partition {table}")
+        
+        for day in [d for d in self._tick_insert_sql if d < cutoff]:
+            del self._tick_insert_sql[day]
+    
+    def _rotate_tick_partitions(self):
+        """Pre-create today's tick partition and drop expired ones (blocking)"""
+        with self._db_lock:
+            try:
+                self._ensure_tick_partition(now_us() // DAY_US)
+                self._drop_expired_tick_partitions()
+            except Exception as e:
+                logging.error(f"Tick partition rotation failed: {e}")
+    
     def add_data_source(self, source: DataSource):
         """Add data source"""
+        source.tick_sink = self._enqueue_tick
         self.sources.append(source)
         self.sources.sort(key=lambda x: x.priority)
         logging.info(f"Added data source: {source.name} (priority: {source.priority})")
@@ -439,10 +826,26 @@ class MarketDataProcessor:
     def add_tick_callback(self, callback):
         """Add callback for new ticks"""
         self.tick_callbacks.append(callback)
+        self._tick_callbacks_t = tuple(c for c in self.tick_callbacks if not asyncio.iscoroutinefunction(c))
+        self._tick_async_callbacks_t = tuple(c for c in self.tick_callbacks if asyncio.iscoroutinefunction(c))
     
     def add_ohlc_callback(self, callback):
         """Add callback for OHLC data"""
         self.ohlc_callbacks.append(callback)
+        self._ohlc_callbacks_t = tuple(c for c in self.ohlc_callbacks if not asyncio.iscoroutinefunction(c))
+        self._ohlc_async_callbacks_t = tuple(c for c in self.ohlc_callbacks if asyncio.iscoroutinefunction(c))
+    
+    def _spawn_task(self, coro):
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+    
+    def _on_task_done(self, task: asyncio.Task):
+        """Release a finished background task and log its failure, if any"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"Background task error: {task.exception()}")
     
     async def connect_sources(self):
         """Connect to all data sources"""
@@ -468,122 +871,215 @@ class MarketDataProcessor:
             except Exception as e:
                 logging.error(f"Error disconnecting {source.name}: {e}")
     
-    def _save_tick(self, tick: MarketTick):
-        """Save tick to database"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO ticks 
-                    (symbol, timestamp, bid, ask, last, volume, high, low, open, close)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    tick.symbol, tick.timestamp, tick.bid, tick.ask, tick.last,
-                    tick.volume, tick.high, tick.low, tick.open, tick.close
-                ))
-                conn.commit()
-        except Exception as e:
-            logging.error(f"Failed to save tick: {e}")
+    def _save_tick(self, tick: MarketTick) -> bool:
+        """Queue tick for the next batched database write; True once a flush is due"""
+        with self._write_lock:
+            self._tick_write_buf.append((
+                tick.symbol, tick.timestamp, tick.bid, tick.ask, tick.last,
+                tick.volume, tick.high, tick.low, tick.open, tick.close
+            ))
+            return (len(self._tick_write_buf) >= self.write_batch_size or
+                    time.monotonic() - self._last_flush >= self.write_flush_interval)
     
-    def _process_ohlc(self, symbol: str):
-        """Process ticks into OHLC data"""
-        try:
-            if symbol not in self.tick_buffer or not self.tick_buffer[symbol]:
-                return
-            
-            ticks = self.tick_buffer[symbol]
-            now = datetime.now()
-            minute_start = now.replace(second=0, microsecond=0)
+    def flush_writes(self):
+        """Commit all buffered ticks and OHLC bars in one transaction (blocking)"""
+        # Swap the buffers out so producers are never held up by disk I/O
+        with self._write_lock:
+            ticks, self._tick_write_buf = self._tick_write_buf, []
+            bars, self._ohlc_write_buf = list(self._ohlc_write_buf.values()), {}
+            self._last_flush = time.monotonic()
+        
+        if not ticks and not bars:
+            return
+        
+        with self._db_lock:
+            try:
+                self._conn.execute("BEGIN")
+                if ticks:
+                    first_day = ticks[0][1] // DAY_US
+                    if first_day == ticks[-1][1] // DAY_US:
+                        self._conn.executemany(self._ensure_tick_partition(first_day), ticks)
+                    else:
+                        # Batch straddles UTC midnight: split it across partitions
+                        by_day: Dict[int, List[tuple]] = {}
+                        for row in ticks:
+                            by_day.setdefault(row[1] // DAY_US, []).append(row)
+                        for day, rows in by_day.items():
+                            self._conn.executemany(self._ensure_tick_partition(day), rows)
+                if bars:
+                    self._conn.executemany(self._stage_ohlc_sql, bars)
+                    self._conn.execute(self._merge_ohlc_sql)
+                    self._conn.execute("DELETE FROM ohlc_1m_stage")
+                self._conn.execute("COMMIT")
+                if bars:
+                    self._ohlc_generation += 1
+                    self._ohlc_cache.clear()
+            except Exception as e:
+                logging.error(f"Failed to save ticks: {e}")
+                try:
+                    self._conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+                # A partition created inside the failed transaction was rolled back too
+                self._tick_insert_sql.clear()
+                self._requeue_writes(ticks, bars)
+    
+    def _requeue_writes(self, ticks: List[tuple], bars: List[tuple]):
+        """Put a failed batch back ahead of newer writes so the next flush retries it"""
+        with self._write_lock:
+            pending = ticks + self._tick_write_buf
+            overflow = len(pending) - self.max_pending_ticks
+            if overflow > 0:
+                # Writes have been failing for a long time: keep the newest ticks
+                logging.warning(f"Dropping {overflow} unsaved ticks after repeated write failures")
+                pending = pending[overflow:]
+            self._tick_write_buf = pending
             
-            # Filter ticks for current minute
-            minute_ticks = [
-                t for t in ticks 
-                if t.timestamp >= minute_start and t.timestamp < minute_start + timedelta(minutes=1)
-            ]
+            # Bars queued since the swap are newer states of the same bar and win
+            merged = {(row[0], row[1]): row for row in bars}
+            merged.update(self._ohlc_write_buf)
+            self._ohlc_write_buf = merged
+    
+    def _soa_append(self, tick: MarketTick):
+        """Append a tick to its symbol's column ring buffer, evicting the oldest when full"""
+        soa = self.tick_soa.get(tick.symbol)
+        if soa is None:
+            # Each column is stored twice back to back, so the live window
+            # [start, start + n) is always one contiguous slice
+            cap = self.tick_buffer_capacity
+            soa = self.tick_soa[tick.symbol] = {
+                'ts': np.empty(2 * cap, 'i8'),
+                'last': np.empty(2 * cap, 'f4'),
+                'vol': np.empty(2 * cap, 'i4'),
+                'cap': cap,
+                'start': 0,
+                'n': 0
+            }
+        
+        cap, start, n = soa['cap'], soa['start'], soa['n']
+        w = (start + n) % cap
+        soa['ts'][w] = soa['ts'][w + cap] = tick.timestamp
+        soa['last'][w] = soa['last'][w + cap] = tick.last
+        soa['vol'][w] = soa['vol'][w + cap] = tick.volume
+        
+        if n == cap:
+            soa['start'] = (start + 1) % cap
+        else:
+            soa['n'] = n + 1
+    
+    def _process_ohlc(self, tick: MarketTick):
+        """Fold a tick into its symbol's running 1-minute bar"""
+        try:
+            symbol = tick.symbol
+            bucket = tick.timestamp // MINUTE_US
+            bar = self.current_bar.get(symbol)
             
-            if not minute_ticks:
-                return
+            if bar is None:
+                if bucket <= self._closed_bucket.get(symbol, -1):
+                    return  # late tick for a minute the timer already closed
+                bar = self.current_bar[symbol] = new_bar_state()
             
-            # Create OHLC
-            prices = [t.last for t in minute_ticks]
-            volumes = [t.volume for t in minute_ticks]
+            result = update_bar(bar, tick.last, tick.volume, bucket)
+            if result == BAR_LATE:
+                return  # late tick for a bar that has already rolled over
+            if result == BAR_OPENED:
+                # New minute: the previous bar's last upsert is already its final state
+                self._bar_timestamp[symbol] = datetime.fromtimestamp(bucket * 60)
             
+            timestamp = self._bar_timestamp[symbol]
             ohlc_data = {
                 'symbol': symbol,
-                'timestamp': minute_start,
-                'open': prices[0],
-                'high': max(prices),
-                'low': min(prices),
-                'close': prices[-1],
-                'volume': sum(volumes),
-                'tick_count': len(minute_ticks)
+                'timestamp': timestamp,
+                'open': float(bar[BAR_OPEN]),
+                'high': float(bar[BAR_HIGH]),
+                'low': float(bar[BAR_LOW]),
+                'close': float(bar[BAR_CLOSE]),
+                'volume': int(bar[BAR_VOLUME]),
+                'tick_count': int(bar[BAR_COUNT])
             }
             
-            # Save to database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO ohlc_1m 
-                    (symbol, timestamp, open, high, low, close, volume, tick_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # Queue upsert; later updates of the same bar replace it before the flush
+            with self._write_lock:
+                self._ohlc_write_buf[(symbol, timestamp)] = (
                     ohlc_data['symbol'], ohlc_data['timestamp'],
                     ohlc_data['open'], ohlc_data['high'], ohlc_data['low'],
                     ohlc_data['close'], ohlc_data['volume'], ohlc_data['tick_count']
-                ))
-                conn.commit()
+                )
             
             # Notify callbacks
-            for callback in self.ohlc_callbacks:
+            for callback in self._ohlc_callbacks_t:
                 try:
                     callback(ohlc_data)
                 except Exception as e:
                     logging.error(f"OHLC callback error: {e}")
-            
-            # Clean old ticks (keep last 100)
-            if len(self.tick_buffer[symbol]) > 100:
-                self.tick_buffer[symbol] = self.tick_buffer[symbol][-100:]
+            for callback in self._ohlc_async_callbacks_t:
+                self._spawn_task(callback(ohlc_data))
         
         except Exception as e:
             logging.error(f"OHLC processing error: {e}")
     
-    async def _processing_loop(self):
-        """Main data processing loop"""
-        logging.info("Data processing loop started")
+    def _enqueue_tick(self, tick: MarketTick):
+        """Hand a tick to the pipeline, dropping the oldest queued tick if full"""
+        if self.tick_queue is None:
+            return
+        try:
+            self.tick_queue.put_nowait(tick)
+        except asyncio.QueueFull:
+            try:
+                self.tick_queue.get_nowait().release()
+                self.dropped_ticks += 1
+            except asyncio.QueueEmpty:
+                pass
+            self.tick_queue.put_nowait(tick)
+    
+    async def _race_sources(self, symbol: str) -> Optional[MarketTick]:
+        """Query all healthy polled sources at once and keep the first tick returned"""
+        pending = {
+            asyncio.create_task(source.get_tick(symbol)): source
+            for source in self.sources
+            if source.is_available() and not source.is_streaming
+        }
+        tick = None
+        
+        try:
+            while pending and tick is None:
+                done, _ = await asyncio.wait(pending, timeout=self.source_timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    source = pending.pop(task)
+                    if task.exception() is not None:
+                        logging.error(f"{source.name} tick error: {task.exception()}")
+                        source.record_error()
+                        continue
+                    result = task.result()
+                    if result and tick is None:
+                        tick = result
+                    elif result:
+                        result.release()  # another source finished in the same pass
+        finally:
+            # Losers are cancelled; only sources that actually raised count as errors
+            for task in pending:
+                task.cancel()
         
+        return tick
+    
+    async def _ingest_source(self, symbol: str):
+        """Producer: poll sources for a symbol and enqueue ticks"""
         while self.is_running:
             try:
-                # Get ticks from all symbols
-                for symbol in self.symbols:
-                    # Try primary source first, then fallback
-                    tick = None
-                    for source in self.sources:
-                        if source.is_healthy():
-                            tick = await source.get_tick(symbol)
-                            if tick:
-                                break
-                    
-                    if tick:
-                        # Initialize buffer if needed
-                        if symbol not in self.tick_buffer:
-                            self.tick_buffer[symbol] = []
-                        
-                        # Add tick to buffer
-                        self.tick_buffer[symbol].append(tick)
-                        
-                        # Save tick
-                        self._save_tick(tick)
-                        
-                        # Process OHLC
-                        self._process_ohlc(symbol)
-                        
-                        # Notify tick callbacks
-                        for callback in self.tick_callbacks:
-                            try:
-                                callback(tick)
-                            except Exception as e:
-                                logging.error(f"Tick callback error: {e}")
-                    
-                    else:
-                        logging.warning(f"No tick data available for {symbol}")
+                # Streaming sources push their own ticks; poll only as a fallback
+                if any(s.is_streaming and s.is_healthy() for s in self.sources):
+                    await asyncio.sleep(self.update_interval)
+                    continue
+                
+                tick = await self._race_sources(symbol)
+                
+                if tick:
+                    self._enqueue_tick(tick)
+                else:
+                    logging.warning(f"No tick data available for {symbol}")
                 
                 # Health check on sources
                 healthy_sources = [s for s in self.sources if s.is_healthy()]
@@ -592,10 +1088,105 @@ class MarketDataProcessor:
                 
                 await asyncio.sleep(self.update_interval)
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logging.error(f"Processing loop error: {e}")
+                logging.error(f"Ingest error for {symbol}: {e}")
                 await asyncio.sleep(5)  # Error backoff
     
+    async def _persist_worker(self):
+        """Consumer: drain queued ticks into the batched database writer"""
+        while True:
+            try:
+                tick = await asyncio.wait_for(self.tick_queue.get(), timeout=self.write_flush_interval)
+            except asyncio.TimeoutError:
+                # Idle: commit any partial batch
+                await asyncio.to_thread(self.flush_writes)
+                continue
+            
+            # Take whatever else is already queued in the same pass
+            batch = [tick]
+            while len(batch) < self.write_batch_size and not self.tick_queue.empty():
+                batch.append(self.tick_queue.get_nowait())
+            
+            # Aggregation only needs the ticks in memory; hand them over before touching disk
+            self._aggregate_queue.put_nowait(batch)
+            
+            try:
+                flush_due = False
+                for tick in batch:
+                    flush_due = self._save_tick(tick) or flush_due
+                if flush_due:
+                    await asyncio.to_thread(self.flush_writes)
+            except Exception as e:
+                logging.error(f"Persist error: {e}")
+    
+    async def _aggregate_worker(self):
+        """Consumer: update tick buffers, build OHLC bars and notify callbacks"""
+        while True:
+            batch = await self._aggregate_queue.get()
+            try:
+                for tick in batch:
+                    # Initialize buffer if needed
+                    buffer = self.tick_buffer.get(tick.symbol)
+                    if buffer is None:
+                        buffer = self.tick_buffer[tick.symbol] = deque(maxlen=self.tick_buffer_capacity)
+                    
+                    # Add tick to buffer, recycling the tick it evicts
+                    if len(buffer) == buffer.maxlen:
+                        buffer[0].release()
+                    buffer.append(tick)
+                    self._soa_append(tick)
+                    
+                    # Process OHLC
+                    self._process_ohlc(tick)
+                    
+                    # Notify tick callbacks; they may keep the tick, so it leaves the pool
+                    if self._tick_callbacks_t or self._tick_async_callbacks_t:
+                        tick.share()
+                    for callback in self._tick_callbacks_t:
+                        try:
+                            callback(tick)
+                        except Exception as e:
+                            logging.error(f"Tick callback error: {e}")
+                    for callback in self._tick_async_callbacks_t:
+                        self._spawn_task(callback(tick))
+            except Exception as e:
+                logging.error(f"Aggregation error: {e}")
+    
+    def _schedule_minute_timer(self):
+        """Arm a one-shot timer for the next wall-clock minute boundary"""
+        loop = asyncio.get_running_loop()
+        wall = time.time()
+        next_minute = (wall // 60 + 1) * 60
+        self._minute_timer_bucket = int(next_minute // 60)
+        self._minute_timer = loop.call_at(loop.time() + (next_minute - wall), self._on_minute)
+    
+    def _on_minute(self):
+        """Close bars from the minute that just ended, persist them and re-arm the timer"""
+        boundary = self._minute_timer_bucket
+        for symbol, bar in list(self.current_bar.items()):
+            if bar[BAR_BUCKET] < boundary:
+                # The bar's last queued upsert is its final state
+                del self.current_bar[symbol]
+                self._closed_bucket[symbol] = int(bar[BAR_BUCKET])
+        
+        if self.is_running:
+            self._spawn_task(asyncio.to_thread(self.flush_writes))
+            if boundary % MINUTES_PER_DAY == 0:
+                # UTC midnight: open the new day's tick partition ahead of its first flush
+                self._spawn_task(asyncio.to_thread(self._rotate_tick_partitions))
+            self._schedule_minute_timer()
+    
+    async def _processing_loop(self):
+        """Run the ingest producers and the persist/aggregate consumers"""
+        logging.info("Data processing pipeline started")
+        await asyncio.gather(
+            *(self._ingest_source(symbol) for symbol in self.symbols),
+            self._persist_worker(),
+            self._aggregate_worker()
+        )
+    
     async def start(self):
         """Start data processing"""
         if self.is_running:
@@ -604,17 +1195,19 @@ class MarketDataProcessor:
         
         logging.info("Starting market data processor...")
         
+        # Queues exist before connecting so streaming sources can push right away
+        self.tick_queue = asyncio.Queue(maxsize=self.tick_queue_size)
+        self._aggregate_queue = asyncio.Queue()
+        
         # Connect to sources
         if not await self.connect_sources():
             logging.error("Failed to connect to any data sources")
             return False
         
-        # Start processing
+        # Start processing as a task on the running event loop
         self.is_running = True
-        self.processing_thread = threading.Thread(
-            target=lambda: asyncio.run(self._processing_loop())
-        )
-        self.processing_thread.start()
+        self.processing_task = asyncio.create_task(self._processing_loop())
+        self._schedule_minute_timer()
         
         logging.info("Market data processor started successfully")
         return True
@@ -625,33 +1218,74 @@ class MarketDataProcessor:
         
         self.is_running = False
         
-        if self.processing_thread:
-            self.processing_thread.join(timeout=10)
+        if self._minute_timer:
+            self._minute_timer.cancel()
+            self._minute_timer = None
+        
+        if self.processing_task:
+            self.processing_task.cancel()
+            await asyncio.gather(self.processing_task, return_exceptions=True)
+            self.processing_task = None
+        
+        # Persist ticks still waiting in the queue
+        if self.tick_queue:
+            while not self.tick_queue.empty():
+                self._save_tick(self.tick_queue.get_nowait())
+        await asyncio.to_thread(self.flush_writes)
         
         await self.disconnect_sources()
         
         logging.info("Market data processor stopped")
     
     def get_latest_tick(self, symbol: str) -> Optional[MarketTick]:
-        """Get latest tick for symbol"""
+        """Get a copy of the latest tick for symbol (safe to keep and read from any thread)"""
         if symbol in self.tick_buffer and self.tick_buffer[symbol]:
-            return self.tick_buffer[symbol][-1]
+            return replace(self.tick_buffer[symbol][-1])
         return None
     
+    def get_price_range(self, symbol: str, ticks: int = None) -> Optional[Tuple[float, float]]:
+        """Get (low, high) of the last traded prices over the most recent ticks"""
+        soa = self.tick_soa.get(symbol)
+        if soa is None:
+            return None
+        
+        n = soa['n'] if ticks is None else min(ticks, soa['n'])
+        if n <= 0:
+            return None
+        end = soa['start'] + soa['n']
+        low, high = window_min_max(soa['last'][end - n:end])
+        return float(low), float(high)
+    
     def get_ohlc_data(self, symbol: str, periods: int = 100) -> pd.DataFrame:
-        """Get OHLC data from database"""
+        """Get OHLC data, served from the L1 cache until new bars are written.
+
+        Each caller gets its own copy, so in-place changes never reach the cache.
+        """
+        key = (symbol, periods)
+        cached = self._ohlc_cache.get(key)
+        if cached is not None and cached[1] > now_us() and cached[2] == self._ohlc_generation:
+            return cached[0].copy()
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                query = """
-                    SELECT timestamp, open, high, low, close, volume, tick_count
-                    FROM ohlc_1m 
-                    WHERE symbol = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """
-                df = pd.read_sql_query(query, conn, params=(symbol, periods))
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-                return df.sort_values('timestamp')
+            query = """
+                SELECT timestamp, open, high, low, close, volume, tick_count
+                FROM ohlc_1m 
+                WHERE symbol = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """
+            with self._db_lock:
+                rows = self._conn.execute(query, (symbol, periods)).fetchall()
+                generation = self._ohlc_generation
+            
+            # Newest-first from the index; reverse to chronological order
+            rows.reverse()
+            df = pd.DataFrame.from_records(rows, columns=OHLC_COLUMNS).astype(OHLC_DTYPES)
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # A flush may have committed since the read; a stale frame is returned but not cached
+            if generation == self._ohlc_generation:
+                self._ohlc_cache[key] = (df, now_us() + self.ohlc_cache_ttl * 1_000_000, generation)
+            return df.copy()
         except Exception as e:
             logging.error(f"Failed to get OHLC data: {e}")
             return pd.DataFrame()
@@ -665,6 +1299,8 @@ class MarketDataProcessor:
             'primary_source': self.primary_source.name if self.primary_source else None,
             'symbols_tracked': len(self.symbols),
             'tick_buffer_size': sum(len(buffer) for buffer in self.tick_buffer.values()),
+            'tick_queue_size': self.tick_queue.qsize() if self.tick_queue else 0,
+            'dropped_ticks': self.dropped_ticks,
             'sources': []
         }
         
@@ -675,7 +1311,8 @@ class MarketDataProcessor:
                 'is_connected': source.is_connected,
                 'is_healthy': source.is_healthy(),
                 'error_count': source.error_count,
-                'last_update': source.last_update.isoformat() if source.last_update else None
+                'in_cooldown': source.in_cooldown(),
+                'last_update': datetime.fromtimestamp(source.last_update / 1_000_000).isoformat() if source.last_update else None
             }
             status['sources'].append(source_status)
         
@@ -726,7 +1363,7 @@ class MarketDataProcessor:
                 # Return minimal data if no history
                 return MultiTimeframeData(
                     symbol=symbol,
-                    timestamp=current_tick.timestamp,
+                    timestamp=current_tick.as_datetime(),
                     current_candle=current_candle,
                     previous_candle=current_candle.copy(),
                     timeframes={}
@@ -743,12 +1380,13 @@ class MarketDataProcessor:
                 closes, highs, lows, opens
             )
             
+            # Plain Python numbers: the float32/int32 frame values aren't JSON-native
             previous_candle = {
-                'open': df.iloc[-2]['open'] if len(df) > 1 else current_tick.open,
-                'high': df.iloc[-2]['high'] if len(df) > 1 else current_tick.high,
-                'low': df.iloc[-2]['low'] if len(df) > 1 else current_tick.low,
-                'close': df.iloc[-2]['close'] if len(df) > 1 else current_tick.close,
-                'volume': df.iloc[-2]['volume'] if len(df) > 1 else current_tick.volume,
+                'open': float(df.iloc[-2]['open']) if len(df) > 1 else current_tick.open,
+                'high': float(df.iloc[-2]['high']) if len(df) > 1 else current_tick.high,
+                'low': float(df.iloc[-2]['low']) if len(df) > 1 else current_tick.low,
+                'close': float(df.iloc[-2]['close']) if len(df) > 1 else current_tick.close,
+                'volume': int(df.iloc[-2]['volume']) if len(df) > 1 else current_tick.volume,
                 **previous_indicators
             }
             
@@ -761,7 +1399,7 @@ class MarketDataProcessor:
             
             return MultiTimeframeData(
                 symbol=symbol,
-                timestamp=current_tick.timestamp,
+                timestamp=current_tick.as_datetime(),
                 current_candle=current_candle,
                 previous_candle=previous_candle,
                 timeframes=timeframes
@@ -988,8 +1626,8 @@ class MarketDataProcessor:
                     VALUES (?, ?, ?, ?)
                 """, (
                     datetime.now(), symbol, 
-                    json.dumps(ea_data), 
-                    json.dumps(response)
+                    orjson.dumps(ea_data, option=orjson.OPT_SERIALIZE_NUMPY).decode(), 
+                    orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY).decode()
                 ))
                 conn.commit()
             
@@ -1021,6 +1659,10 @@ async def main():
     # av_source = AlphaVantageSource("demo")
     # processor.add_data_source(av_source)
     
+    # Add a streaming quote feed (replace with a real websocket endpoint)
+    # ws_source = WebsocketSource("wss://example.com/quotes", symbol_map={"XAU/USD": "XAUUSD"})
+    # processor.add_data_source(ws_source)
+    
     # Add callbacks
     def tick_callback(tick):
         print(f"New tick: {tick.symbol} @ {tick.last:.2f} (Bid: {tick.bid:.2f}, Ask: {tick.ask:.2f})")
@@ -1040,7 +1682,7 @@ async def main():
         
         # Show status
         status = processor.get_health_status()
-        print(f"\nSystem Status: {json.dumps(status, indent=2)}")
+        print(f"\nSystem Status: {orjson.dumps(status, option=orjson.OPT_INDENT_2).decode()}")
         
         # Show recent OHLC data
         ohlc_data = processor.get_ohlc_data("XAUUSD", 10)
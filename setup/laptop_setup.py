@@ -294,8 +294,8 @@ class LaptopSetup:
                 "gpu_memory_limit_mb": 5120,
                 "mixed_precision": True,
                 "xla_acceleration": True,
-                "inter_op_threads": 6,
-                "intra_op_threads": 12
+                "inter_op_threads": max(1, min(4, self.cpu_cores // 2)),
+                "intra_op_threads": self.cpu_cores
             },
             "trading": {
                 "max_concurrent_models": 3,
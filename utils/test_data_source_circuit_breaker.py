@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test Data Source Circuit Breaker
+Checks that repeated source failures open the circuit and that the cooldown
+doubles on each repeated trip. Uses only the standard library.
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "data"))
+
+from circuit_breaker import CircuitBreaker
+
+def test_record_error_opens_circuit_and_doubles_backoff():
+    """max_errors failures trip the breaker; the next trip waits twice as long"""
+    breaker = CircuitBreaker("Test")
+
+    for _ in range(breaker.max_errors - 1):
+        breaker.record_error()
+    assert not breaker.in_cooldown()
+    assert breaker.error_count == breaker.max_errors - 1
+
+    breaker.record_error()
+    assert breaker.in_cooldown()
+    assert breaker.error_count == 0
+    first = breaker.cooldown_remaining()
+    assert breaker.cooldown_seconds - 1 < first <= breaker.cooldown_seconds
+
+    # Let the cooldown expire, then fail again
+    breaker._cooldown_until = 0.0
+    assert not breaker.in_cooldown()
+    for _ in range(breaker.max_errors):
+        breaker.record_error()
+    assert breaker.in_cooldown()
+    second = breaker.cooldown_remaining()
+    assert 2 * breaker.cooldown_seconds - 1 < second <= 2 * breaker.cooldown_seconds
+
+def test_record_success_resets_backoff():
+    """A success after a trip starts the next cooldown from the base duration again"""
+    breaker = CircuitBreaker("Test")
+    for _ in range(breaker.max_errors):
+        breaker.record_error()
+    breaker._cooldown_until = 0.0
+    breaker.record_success()
+
+    for _ in range(breaker.max_errors):
+        breaker.record_error()
+    assert breaker.cooldown_seconds - 1 < breaker.cooldown_remaining() <= breaker.cooldown_seconds
+
+def test_backoff_is_capped():
+    """Repeated trips never cool down longer than max_cooldown_seconds"""
+    breaker = CircuitBreaker("Test", max_cooldown_seconds=45.0)
+    for _ in range(3):
+        breaker._cooldown_until = 0.0
+        for _ in range(breaker.max_errors):
+            breaker.record_error()
+    assert breaker.cooldown_remaining() <= 45.0
+
+if __name__ == "__main__":
+    test_record_error_opens_circuit_and_doubles_backoff()
+    test_record_success_resets_backoff()
+    test_backoff_is_capped()
+    print("✅ Circuit breaker tests passed")
@@ -63,7 +63,7 @@ async def test_enhanced_market_data():
             print(f"   Price: ${latest_tick.last:.2f}")
             print(f"   Bid/Ask: ${latest_tick.bid:.2f}/${latest_tick.ask:.2f}")
             print(f"   Volume: {latest_tick.volume}")
-            print(f"   Timestamp: {latest_tick.timestamp}")
+            print(f"   Timestamp: {latest_tick.as_datetime()}")
         else:
             print("   No tick data available")
         